@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Body, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, delete
-from typing import List, Optional, Set
+from sqlalchemy import select, func, delete, insert
+from typing import Dict, List, Optional, Set
 from pydantic import BaseModel
 from app.database import get_db
 from app.models import Session, Fusion, Protein, Domain
 from app.schemas.fusion import (
+    FusionCreate,
     FusionManualInput,
     FusionResponse,
     FusionListResponse,
@@ -33,7 +34,12 @@ class BatchCreateRequest(BaseModel):
     batch_name: Optional[str] = None
 from app.models import Transcript, Gene, Exon
 from app.core.parsers import StarFusionParser, ArribaParser, ManualInputParser
-from app.core.fusion_builder import FusionBuilder, normalize_source_name
+from app.core.fusion_builder import (
+    FusionBuilder,
+    KINASE_RE,
+    domain_statuses,
+    normalize_source_name,
+)
 from app.external.ensembl import get_ensembl_client
 from app.external.interpro import get_interpro_client
 from app.external.cbioportal import get_cbioportal_client
@@ -64,8 +70,8 @@ async def upload_fusion_file(
     db: AsyncSession = Depends(get_db)
 ):
     """Upload a STAR-Fusion or Arriba file."""
-    content = await file.read()
-    content_str = content.decode("utf-8")
+    # Keep only the decoded text; the parsers iterate its lines in place
+    content_str = (await file.read()).decode("utf-8")
 
     # Detect format
     file_format = detect_file_format(content_str)
@@ -95,15 +101,20 @@ async def upload_fusion_file(
     # Build fusions
     ensembl = get_ensembl_client()
     builder = FusionBuilder(db, ensembl)
+    await builder.prefetch(fusion_data_list)
 
+    session_id = session.id
     for fusion_data in fusion_data_list:
         try:
-            await builder.build_fusion(fusion_data, session.id)
+            await builder.build_fusion(fusion_data, session_id)
         except Exception as e:
             import traceback
             logger.error(f"Error building fusion: {e}")
             logger.error(traceback.format_exc())
 
+    # A failed build rolls back, which expires the loaded session
+    await db.refresh(session)
+
     # Get fusion count
     result = await db.execute(
         select(func.count(Fusion.id)).where(Fusion.session_id == session.id)
@@ -195,27 +206,32 @@ async def create_batch_fusions(
         await db.commit()
         await db.refresh(session)
 
-    # Build fusions - use per-fusion genome build
-    # Cache ensembl clients by genome build to avoid recreating
-    ensembl_clients = {}
+    # Build fusions - use per-fusion genome build (default to hg38)
+    # One builder per genome build, so its gene/transcript lookups are shared;
+    # each prefetches its fusions' partners before they are built
+    fusions_by_build: Dict[str, List[FusionCreate]] = {}
+    for fusion_data in fusion_data_list:
+        genome_build = getattr(fusion_data, 'genome_build', None) or "hg38"
+        fusions_by_build.setdefault(genome_build, []).append(fusion_data)
 
+    builders: Dict[str, FusionBuilder] = {}
+    for genome_build, build_fusions in fusions_by_build.items():
+        builders[genome_build] = FusionBuilder(db, get_ensembl_client(genome_build))
+        await builders[genome_build].prefetch(build_fusions)
+
+    session_id = session.id
     for fusion_data in fusion_data_list:
         try:
-            # Get the genome build for this fusion (default to hg38)
             genome_build = getattr(fusion_data, 'genome_build', None) or "hg38"
-
-            # Get or create ensembl client for this genome build
-            if genome_build not in ensembl_clients:
-                ensembl_clients[genome_build] = get_ensembl_client(genome_build)
-
-            ensembl = ensembl_clients[genome_build]
-            builder = FusionBuilder(db, ensembl)
-            await builder.build_fusion(fusion_data, session.id)
+            await builders[genome_build].build_fusion(fusion_data, session_id)
         except Exception as e:
             import traceback
             logger.error(f"Error building fusion: {e}")
             logger.error(traceback.format_exc())
 
+    # A failed build rolls back, which expires the loaded session
+    await db.refresh(session)
+
     result = await db.execute(
         select(func.count(Fusion.id)).where(Fusion.session_id == session.id)
     )
@@ -648,9 +664,10 @@ async def get_visualization_data(
     logger.info(f"Visualization for {fusion.gene_a_symbol}--{fusion.gene_b_symbol}, genome_build={fusion.genome_build}")
     logger.info(f"  Transcript A: {fusion.transcript_a_id}, Transcript B: {fusion.transcript_b_id}")
 
-    # Calculate protein lengths and junction position
-    domains_a = [DomainInfo(**d) for d in (fusion.domains_a or [])]
-    domains_b = [DomainInfo(**d) for d in (fusion.domains_b or [])]
+    # Calculate protein lengths and junction position. Stored domains are
+    # already DomainInfo-shaped (see _fusion_to_detail_response).
+    domains_a = [DomainInfo.model_construct(**d) for d in (fusion.domains_a or [])]
+    domains_b = [DomainInfo.model_construct(**d) for d in (fusion.domains_b or [])]
 
     # Fetch actual protein lengths from database
     # This is important because domain data may be sparse/missing (especially for hg38)
@@ -861,27 +878,29 @@ async def _get_transcript_exons(
 
         # Try to cache them in database for future use (best effort)
         try:
+            # One existence query for the whole transcript instead of one per exon
+            exon_ids = [e["id"] for e in exon_data_list if e.get("id")]
+            result = await db.execute(
+                select(Exon.exon_id).where(
+                    Exon.transcript_id == transcript_id,
+                    Exon.exon_id.in_(exon_ids)
+                )
+            )
+            seen_ids = set(result.scalars().all())
+
             for idx, exon_data in enumerate(exon_data_list):
                 exon_id = exon_data.get("id")
-                if exon_id:
-                    # Check if already exists
-                    existing = await db.execute(
-                        select(Exon).where(
-                            Exon.exon_id == exon_id,
-                            Exon.transcript_id == transcript_id
-                        )
-                    )
-                    if not existing.scalar_one_or_none():
-                        new_exon = Exon(
-                            exon_id=exon_id,
-                            transcript_id=transcript_id,
-                            rank=exon_data.get("rank") or (idx + 1),
-                            start=exon_data.get("start"),
-                            end=exon_data.get("end"),
-                            phase=exon_data.get("phase"),
-                            end_phase=exon_data.get("end_phase")
-                        )
-                        db.add(new_exon)
+                if exon_id and exon_id not in seen_ids:
+                    seen_ids.add(exon_id)
+                    db.add(Exon(
+                        exon_id=exon_id,
+                        transcript_id=transcript_id,
+                        rank=exon_data.get("rank") or (idx + 1),
+                        start=exon_data.get("start"),
+                        end=exon_data.get("end"),
+                        phase=exon_data.get("phase"),
+                        end_phase=exon_data.get("end_phase")
+                    ))
             await db.commit()
             logger.info(f"Cached exons for {transcript_id}")
         except Exception as e:
@@ -904,75 +923,45 @@ async def _get_transcript_exons(
         "cds_end": transcript.cds_end
     }
 
+    cds_start = transcript.cds_start
+    cds_end = transcript.cds_end
+    has_cds = bool(cds_start and cds_end)
+
+    # Exon status based on breakpoint. The kept side depends only on the gene's
+    # role and strand, so resolve it once rather than per exon:
+    # - 5' gene keeps the portion BEFORE the breakpoint (transcription direction),
+    #   i.e. lower coords on + strand, higher coords on - strand
+    # - 3' gene keeps the portion AFTER the breakpoint,
+    #   i.e. higher coords on + strand, lower coords on - strand
+    # Breakpoint within exon (inclusive) = partial
+    retained_below_breakpoint = is_5prime == (strand == "+")
+
     exon_infos = []
     for idx, exon in enumerate(exons):
+        exon_start = exon.start
+        exon_end = exon.end
+
         # Use exon.rank if valid (>0), otherwise use 1-based index
         exon_rank = exon.rank if exon.rank and exon.rank > 0 else idx + 1
 
-        # Determine if exon contains coding sequence
-        is_coding = False
-        cds_start_in_exon = None
-        cds_end_in_exon = None
-
-        if transcript.cds_start and transcript.cds_end:
-            # Check overlap with CDS
-            if exon.start <= transcript.cds_end and exon.end >= transcript.cds_start:
-                is_coding = True
-                cds_start_in_exon = max(exon.start, transcript.cds_start)
-                cds_end_in_exon = min(exon.end, transcript.cds_end)
-
-        # Determine exon status based on breakpoint
-        # For positive strand: low coords = 5' end, high coords = 3' end
-        # For negative strand: high coords = 5' end, low coords = 3' end
-        # Breakpoint within exon (inclusive) = partial
-        status = "unknown"
-        if breakpoint:
-            # First check if breakpoint is within this exon (inclusive boundaries)
-            breakpoint_in_exon = exon.start <= breakpoint <= exon.end
-
-            if is_5prime:
-                # For 5' gene: we keep the portion BEFORE the breakpoint (in transcription direction)
-                if strand == "+":
-                    # Positive strand: "before" means lower genomic coordinates
-                    if breakpoint_in_exon:
-                        status = "partial"  # Breakpoint is within this exon
-                    elif exon.end < breakpoint:
-                        status = "retained"  # Entire exon is before breakpoint
-                    else:
-                        status = "lost"  # Entire exon is after breakpoint
-                else:  # negative strand
-                    # Negative strand: "before" means higher genomic coordinates
-                    if breakpoint_in_exon:
-                        status = "partial"  # Breakpoint is within this exon
-                    elif exon.start > breakpoint:
-                        status = "retained"  # Entire exon is before breakpoint (higher coords)
-                    else:
-                        status = "lost"  # Entire exon is after breakpoint (lower coords)
-            else:
-                # For 3' gene: we keep the portion AFTER the breakpoint (in transcription direction)
-                if strand == "+":
-                    # Positive strand: "after" means higher genomic coordinates
-                    if breakpoint_in_exon:
-                        status = "partial"  # Breakpoint is within this exon
-                    elif exon.start > breakpoint:
-                        status = "retained"  # Entire exon is after breakpoint
-                    else:
-                        status = "lost"  # Entire exon is before breakpoint
-                else:  # negative strand
-                    # Negative strand: "after" means lower genomic coordinates
-                    if breakpoint_in_exon:
-                        status = "partial"  # Breakpoint is within this exon
-                    elif exon.end < breakpoint:
-                        status = "retained"  # Entire exon is after breakpoint (lower coords)
-                    else:
-                        status = "lost"  # Entire exon is before breakpoint (higher coords)
+        # Determine if exon overlaps the CDS
+        is_coding = has_cds and exon_start <= cds_end and exon_end >= cds_start
+
+        if not breakpoint:
+            status = "unknown"
+        elif exon_start <= breakpoint <= exon_end:
+            status = "partial"
+        elif exon_end < breakpoint if retained_below_breakpoint else exon_start > breakpoint:
+            status = "retained"
+        else:
+            status = "lost"
 
         exon_infos.append(ExonInfo(
             rank=exon_rank,
-            start=exon.start,
-            end=exon.end,
-            cds_start=cds_start_in_exon,
-            cds_end=cds_end_in_exon,
+            start=exon_start,
+            end=exon_end,
+            cds_start=max(exon_start, cds_start) if is_coding else None,
+            cds_end=min(exon_end, cds_end) if is_coding else None,
             is_coding=is_coding,
             status=status
         ))
@@ -1165,11 +1154,16 @@ def _build_fusion_transcript(
 
 
 async def _fusion_to_detail_response(fusion: Fusion) -> FusionDetailResponse:
-    """Convert Fusion model to detail response."""
-    domains_a = [DomainInfo(**d) for d in (fusion.domains_a or [])]
-    domains_b = [DomainInfo(**d) for d in (fusion.domains_b or [])]
+    """Convert Fusion model to detail response.
+
+    Stored domain dicts are written in DomainInfo's shape from typed domain
+    columns (by the builder and the domain refresh), and the fusion columns
+    are typed, so the response is constructed without re-validation.
+    """
+    domains_a = [DomainInfo.model_construct(**d) for d in (fusion.domains_a or [])]
+    domains_b = [DomainInfo.model_construct(**d) for d in (fusion.domains_b or [])]
 
-    return FusionDetailResponse(
+    return FusionDetailResponse.model_construct(
         id=fusion.id,
         session_id=fusion.session_id,
         gene_a_symbol=fusion.gene_a_symbol,
@@ -1238,34 +1232,35 @@ async def refresh_fusion_domains(
 
     # Refresh domains for gene A
     if fusion.transcript_a_id:
+        # Only the ID and length are needed, not the stored sequence
         result = await db.execute(
-            select(Protein).where(Protein.transcript_id == fusion.transcript_a_id)
+            select(Protein.id, Protein.length).where(Protein.transcript_id == fusion.transcript_a_id)
         )
-        protein_a = result.scalar_one_or_none()
+        protein_a = result.one_or_none()
 
         if protein_a:
             # Delete existing domains
             await db.execute(
                 delete(Domain).where(Domain.protein_id == protein_a.id)
             )
+            new_domains = []
 
             # Fetch from Ensembl
             ensembl = get_ensembl_client(fusion.genome_build or "hg38")
             try:
                 features = await ensembl.get_protein_features(protein_a.id)
                 for feat in features:
-                    domain = Domain(
-                        protein_id=protein_a.id,
-                        name=feat.get("description", feat.get("type", "Unknown")),
-                        description=feat.get("description"),
-                        source=normalize_source_name(feat.get("type", "Unknown")),
-                        accession=feat.get("id"),
-                        start=feat.get("start"),
-                        end=feat.get("end"),
-                        score=feat.get("score"),
-                        data_provider="Ensembl"
-                    )
-                    db.add(domain)
+                    new_domains.append({
+                        "protein_id": protein_a.id,
+                        "name": feat.get("description", feat.get("type", "Unknown")),
+                        "description": feat.get("description"),
+                        "source": normalize_source_name(feat.get("type", "Unknown")),
+                        "accession": feat.get("id"),
+                        "start": feat.get("start"),
+                        "end": feat.get("end"),
+                        "score": feat.get("score"),
+                        "data_provider": "Ensembl",
+                    })
             except Exception as e:
                 logger.error(f"Error fetching Ensembl domains for {fusion.gene_a_symbol} (protein {protein_a.id}): {e}")
 
@@ -1278,36 +1273,38 @@ async def refresh_fusion_domains(
                     )
                     for d in interpro_domains:
                         if d.get("start") and d.get("end"):
-                            domain = Domain(
-                                protein_id=protein_a.id,
-                                name=d.get("name", "Unknown"),
-                                description=d.get("description"),
-                                source=normalize_source_name(d.get("source", "InterPro")),
-                                accession=d.get("accession"),
-                                start=d.get("start"),
-                                end=d.get("end"),
-                                data_provider=d.get("data_provider", "InterPro")
-                            )
-                            db.add(domain)
+                            new_domains.append({
+                                "protein_id": protein_a.id,
+                                "name": d.get("name", "Unknown"),
+                                "description": d.get("description"),
+                                "source": normalize_source_name(d.get("source", "InterPro")),
+                                "accession": d.get("accession"),
+                                "start": d.get("start"),
+                                "end": d.get("end"),
+                                "score": None,
+                                "data_provider": d.get("data_provider", "InterPro"),
+                            })
                 except Exception as e:
                     logger.error(f"Error fetching InterPro domains for {fusion.gene_a_symbol}: {e}")
 
+            # Build updated domains from the inserted rows; the INSERT returns
+            # them directly and is committed together with the fusion update
             try:
-                await db.commit()
-            except Exception as e:
-                logger.error(f"Error committing gene A domains: {e}")
-                await db.rollback()
+                domains = []
+                if new_domains:
+                    for row in new_domains:
+                        row["is_kinase"] = 1 if KINASE_RE.search(row["name"] or "") else 0
+                    result = await db.execute(
+                        insert(Domain).returning(Domain, sort_by_parameter_order=True),
+                        new_domains
+                    )
+                    domains = result.scalars().all()
 
-            # Get updated domains
-            try:
-                result = await db.execute(
-                    select(Domain).where(Domain.protein_id == protein_a.id)
+                statuses = domain_statuses(
+                    [(d.start, d.end) for d in domains], fusion.aa_breakpoint_a, "5prime"
                 )
-                domains = result.scalars().all()
-
-                for d in domains:
-                    status = _determine_domain_status(d.start, d.end, fusion.aa_breakpoint_a, "5prime")
-                    is_kinase = any(kw in (d.name or "") for kw in ["kinase", "Kinase", "Pkinase", "TyrKc", "S_TKc", "STYKc"])
+                for d, status in zip(domains, statuses):
+                    is_kinase = bool(d.is_kinase)
                     updated_domains_a.append({
                         "name": d.name or "Unknown",
                         "description": d.description,
@@ -1325,34 +1322,35 @@ async def refresh_fusion_domains(
 
     # Refresh domains for gene B
     if fusion.transcript_b_id:
+        # Only the ID and length are needed, not the stored sequence
         result = await db.execute(
-            select(Protein).where(Protein.transcript_id == fusion.transcript_b_id)
+            select(Protein.id, Protein.length).where(Protein.transcript_id == fusion.transcript_b_id)
         )
-        protein_b = result.scalar_one_or_none()
+        protein_b = result.one_or_none()
 
         if protein_b:
             # Delete existing domains
             await db.execute(
                 delete(Domain).where(Domain.protein_id == protein_b.id)
             )
+            new_domains = []
 
             # Fetch from Ensembl
             ensembl = get_ensembl_client(fusion.genome_build or "hg38")
             try:
                 features = await ensembl.get_protein_features(protein_b.id)
                 for feat in features:
-                    domain = Domain(
-                        protein_id=protein_b.id,
-                        name=feat.get("description", feat.get("type", "Unknown")),
-                        description=feat.get("description"),
-                        source=normalize_source_name(feat.get("type", "Unknown")),
-                        accession=feat.get("id"),
-                        start=feat.get("start"),
-                        end=feat.get("end"),
-                        score=feat.get("score"),
-                        data_provider="Ensembl"
-                    )
-                    db.add(domain)
+                    new_domains.append({
+                        "protein_id": protein_b.id,
+                        "name": feat.get("description", feat.get("type", "Unknown")),
+                        "description": feat.get("description"),
+                        "source": normalize_source_name(feat.get("type", "Unknown")),
+                        "accession": feat.get("id"),
+                        "start": feat.get("start"),
+                        "end": feat.get("end"),
+                        "score": feat.get("score"),
+                        "data_provider": "Ensembl",
+                    })
             except Exception as e:
                 logger.error(f"Error fetching Ensembl domains for {fusion.gene_b_symbol} (protein {protein_b.id}): {e}")
 
@@ -1365,36 +1363,38 @@ async def refresh_fusion_domains(
                     )
                     for d in interpro_domains:
                         if d.get("start") and d.get("end"):
-                            domain = Domain(
-                                protein_id=protein_b.id,
-                                name=d.get("name", "Unknown"),
-                                description=d.get("description"),
-                                source=normalize_source_name(d.get("source", "InterPro")),
-                                accession=d.get("accession"),
-                                start=d.get("start"),
-                                end=d.get("end"),
-                                data_provider=d.get("data_provider", "InterPro")
-                            )
-                            db.add(domain)
+                            new_domains.append({
+                                "protein_id": protein_b.id,
+                                "name": d.get("name", "Unknown"),
+                                "description": d.get("description"),
+                                "source": normalize_source_name(d.get("source", "InterPro")),
+                                "accession": d.get("accession"),
+                                "start": d.get("start"),
+                                "end": d.get("end"),
+                                "score": None,
+                                "data_provider": d.get("data_provider", "InterPro"),
+                            })
                 except Exception as e:
                     logger.error(f"Error fetching InterPro domains for {fusion.gene_b_symbol}: {e}")
 
+            # Build updated domains from the inserted rows; the INSERT returns
+            # them directly and is committed together with the fusion update
             try:
-                await db.commit()
-            except Exception as e:
-                logger.error(f"Error committing gene B domains: {e}")
-                await db.rollback()
+                domains = []
+                if new_domains:
+                    for row in new_domains:
+                        row["is_kinase"] = 1 if KINASE_RE.search(row["name"] or "") else 0
+                    result = await db.execute(
+                        insert(Domain).returning(Domain, sort_by_parameter_order=True),
+                        new_domains
+                    )
+                    domains = result.scalars().all()
 
-            # Get updated domains
-            try:
-                result = await db.execute(
-                    select(Domain).where(Domain.protein_id == protein_b.id)
+                statuses = domain_statuses(
+                    [(d.start, d.end) for d in domains], fusion.aa_breakpoint_b, "3prime"
                 )
-                domains = result.scalars().all()
-
-                for d in domains:
-                    status = _determine_domain_status(d.start, d.end, fusion.aa_breakpoint_b, "3prime")
-                    is_kinase = any(kw in (d.name or "") for kw in ["kinase", "Kinase", "Pkinase", "TyrKc", "S_TKc", "STYKc"])
+                for d, status in zip(domains, statuses):
+                    is_kinase = bool(d.is_kinase)
                     updated_domains_b.append({
                         "name": d.name or "Unknown",
                         "description": d.description,
@@ -1410,7 +1410,7 @@ async def refresh_fusion_domains(
             except Exception as e:
                 logger.error(f"Error fetching updated domains for gene B: {e}")
 
-    # Update fusion with new domains
+    # Update fusion with new domains; one commit covers the domain rows too
     try:
         fusion.domains_a = updated_domains_a
         fusion.domains_b = updated_domains_b
@@ -1430,32 +1430,6 @@ async def refresh_fusion_domains(
     return await _fusion_to_detail_response(fusion)
 
 
-def _determine_domain_status(
-    domain_start: int,
-    domain_end: int,
-    breakpoint: Optional[int],
-    position: str
-) -> str:
-    """Determine if a domain is retained, truncated, or lost."""
-    if breakpoint is None or domain_start is None or domain_end is None:
-        return "unknown"
-
-    if position == "5prime":
-        if domain_end <= breakpoint:
-            return "retained"
-        elif domain_start >= breakpoint:
-            return "lost"
-        else:
-            return "truncated"
-    else:
-        if domain_start >= breakpoint:
-            return "retained"
-        elif domain_end <= breakpoint:
-            return "lost"
-        else:
-            return "truncated"
-
-
 @router.get("/{session_id}/{fusion_id}/mutations", response_model=MutationResponse)
 async def get_fusion_mutations(
     session_id: str,
@@ -1508,8 +1482,10 @@ async def get_fusion_mutations(
             exons_a_data = [
                 {"start": e.start, "end": e.end, "rank": e.rank}
                 for e in (await db.execute(
-                    select(Exon).where(Exon.transcript_id == fusion.transcript_a_id).order_by(Exon.rank)
-                )).scalars().all()
+                    select(Exon.start, Exon.end, Exon.rank)
+                    .where(Exon.transcript_id == fusion.transcript_a_id)
+                    .order_by(Exon.rank)
+                ))
             ]
 
     transcript_b = None
@@ -1522,8 +1498,10 @@ async def get_fusion_mutations(
             exons_b_data = [
                 {"start": e.start, "end": e.end, "rank": e.rank}
                 for e in (await db.execute(
-                    select(Exon).where(Exon.transcript_id == fusion.transcript_b_id).order_by(Exon.rank)
-                )).scalars().all()
+                    select(Exon.start, Exon.end, Exon.rank)
+                    .where(Exon.transcript_id == fusion.transcript_b_id)
+                    .order_by(Exon.rank)
+                ))
             ]
 
     # Fetch variants for both genes in parallel (ClinVar + gnomAD)
@@ -1804,8 +1782,10 @@ async def get_fusion_clinvar_variants(
             exons_a_data = [
                 {"start": e.start, "end": e.end, "rank": e.rank}
                 for e in (await db.execute(
-                    select(Exon).where(Exon.transcript_id == fusion.transcript_a_id).order_by(Exon.rank)
-                )).scalars().all()
+                    select(Exon.start, Exon.end, Exon.rank)
+                    .where(Exon.transcript_id == fusion.transcript_a_id)
+                    .order_by(Exon.rank)
+                ))
             ]
 
     transcript_b = None
@@ -1818,8 +1798,10 @@ async def get_fusion_clinvar_variants(
             exons_b_data = [
                 {"start": e.start, "end": e.end, "rank": e.rank}
                 for e in (await db.execute(
-                    select(Exon).where(Exon.transcript_id == fusion.transcript_b_id).order_by(Exon.rank)
-                )).scalars().all()
+                    select(Exon.start, Exon.end, Exon.rank)
+                    .where(Exon.transcript_id == fusion.transcript_b_id)
+                    .order_by(Exon.rank)
+                ))
             ]
 
     # Fetch variants for both genes in parallel
@@ -1852,49 +1834,43 @@ async def get_fusion_clinvar_variants(
         return_exceptions=True
     )
 
-    variants = []
-
-    # Process gene A variants
+    # Filter to the retained region of each gene on the raw dicts, so only
+    # variants that make it into the response are built into models
+    retained = []
     if isinstance(results[0], list):
-        for var in results[0]:
-            # Filter to retained region if breakpoint is known
-            if var.get("position") is not None:
-                if fusion.aa_breakpoint_a is None or var["position"] <= fusion.aa_breakpoint_a:
-                    variants.append(ClinVarVariant(
-                        clinvar_id=var.get("clinvar_id", ""),
-                        accession=var.get("accession", ""),
-                        title=var.get("title", ""),
-                        position=var.get("position"),
-                        protein_change=var.get("protein_change", ""),
-                        clinical_significance=var.get("clinical_significance", ""),
-                        conditions=var.get("conditions", []),
-                        review_status=var.get("review_status", ""),
-                        gene=fusion.gene_a_symbol,
-                    ))
-
-    # Process gene B variants
+        bp_a = fusion.aa_breakpoint_a
+        retained.extend(
+            (var, fusion.gene_a_symbol) for var in results[0]
+            if var.get("position") is not None and (bp_a is None or var["position"] <= bp_a)
+        )
     if isinstance(results[1], list):
-        for var in results[1]:
-            if var.get("position") is not None:
-                if fusion.aa_breakpoint_b is None or var["position"] >= fusion.aa_breakpoint_b:
-                    variants.append(ClinVarVariant(
-                        clinvar_id=var.get("clinvar_id", ""),
-                        accession=var.get("accession", ""),
-                        title=var.get("title", ""),
-                        position=var.get("position"),
-                        protein_change=var.get("protein_change", ""),
-                        clinical_significance=var.get("clinical_significance", ""),
-                        conditions=var.get("conditions", []),
-                        review_status=var.get("review_status", ""),
-                        gene=fusion.gene_b_symbol,
-                    ))
+        bp_b = fusion.aa_breakpoint_b
+        retained.extend(
+            (var, fusion.gene_b_symbol) for var in results[1]
+            if var.get("position") is not None and (bp_b is None or var["position"] >= bp_b)
+        )
+
+    variants = [
+        ClinVarVariant(
+            clinvar_id=var.get("clinvar_id", ""),
+            accession=var.get("accession", ""),
+            title=var.get("title", ""),
+            position=var.get("position"),
+            protein_change=var.get("protein_change", ""),
+            clinical_significance=var.get("clinical_significance", ""),
+            conditions=var.get("conditions", []),
+            review_status=var.get("review_status", ""),
+            gene=gene,
+        )
+        for var, gene in retained[:max_results]
+    ]
 
-    logger.info(f"Found {len(variants)} ClinVar variants for fusion")
+    logger.info(f"Found {len(retained)} ClinVar variants for fusion")
 
     return ClinVarResponse(
         gene_symbol=f"{fusion.gene_a_symbol}--{fusion.gene_b_symbol}",
-        variants=variants[:max_results],
-        total_count=len(variants)
+        variants=variants,
+        total_count=len(retained)
     )
 
 
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func
 from typing import List
+from pydantic import TypeAdapter
 from app.database import get_db
 from app.models import Gene, Protein, Domain
 from app.schemas.gene import GeneSearchResult, ProteinDomainsResponse, DomainResponse
@@ -9,6 +10,10 @@ from app.external.ensembl import get_ensembl_client
 
 router = APIRouter()
 
+# Validate ORM rows as one list rather than one model_validate call per row
+_gene_results_adapter = TypeAdapter(List[GeneSearchResult])
+_domain_responses_adapter = TypeAdapter(List[DomainResponse])
+
 
 @router.get("/search", response_model=List[GeneSearchResult])
 async def search_genes(
@@ -20,16 +25,29 @@ async def search_genes(
     if len(q) < 2:
         raise HTTPException(400, "Query must be at least 2 characters")
 
-    # First check cache
+    # First check cache. Prefix matches are a range scan on the lower(symbol)
+    # index; the leading-wildcard substring match only fills remaining slots.
+    q_lower = q.lower()
     result = await db.execute(
         select(Gene)
-        .where(Gene.symbol.ilike(f"%{q}%"))
+        .where(func.lower(Gene.symbol) >= q_lower)
+        .where(func.lower(Gene.symbol) < q_lower + "\U0010ffff")
+        .order_by(func.lower(Gene.symbol))
         .limit(limit)
     )
-    genes = result.scalars().all()
+    genes = list(result.scalars().all())
+
+    if len(genes) < limit:
+        result = await db.execute(
+            select(Gene)
+            .where(Gene.symbol.ilike(f"%{q}%"))
+            .where(Gene.id.not_in([g.id for g in genes]))
+            .limit(limit - len(genes))
+        )
+        genes.extend(result.scalars().all())
 
     if genes:
-        return [GeneSearchResult.model_validate(g) for g in genes]
+        return _gene_results_adapter.validate_python(genes, from_attributes=True)
 
     # If not in cache, search Ensembl
     ensembl = get_ensembl_client()
@@ -52,15 +70,17 @@ async def get_protein_domains(
     db: AsyncSession = Depends(get_db)
 ):
     """Get protein domains by protein ID."""
-    # Check cache
+    # Check cache (without loading the stored sequence)
     result = await db.execute(
-        select(Protein).where(Protein.id == protein_id)
+        select(Protein.id, Protein.transcript_id, Protein.length).where(Protein.id == protein_id)
     )
-    protein = result.scalar_one_or_none()
+    protein = result.one_or_none()
 
     if protein:
+        # Insertion order; the (protein_id, start, end) index would otherwise
+        # hand rows back sorted by span
         domain_result = await db.execute(
-            select(Domain).where(Domain.protein_id == protein_id)
+            select(Domain).where(Domain.protein_id == protein_id).order_by(Domain.id)
         )
         domains = domain_result.scalars().all()
 
@@ -68,7 +88,7 @@ async def get_protein_domains(
             protein_id=protein.id,
             transcript_id=protein.transcript_id,
             length=protein.length or 0,
-            domains=[DomainResponse.model_validate(d) for d in domains]
+            domains=_domain_responses_adapter.validate_python(domains, from_attributes=True)
         )
 
     # Fetch from Ensembl
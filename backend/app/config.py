@@ -6,6 +6,7 @@ class Settings(BaseSettings):
     database_url: str = "sqlite+aiosqlite:///data/fusion_cache.db"
     ensembl_api_url: str = "https://rest.ensembl.org"
     ensembl_rate_limit: int = 15  # requests per second
+    ensembl_burst: int = 30  # requests allowed back-to-back before rate limiting
 
     class Config:
         env_file = ".env"
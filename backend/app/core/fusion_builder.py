@@ -1,19 +1,74 @@
+import asyncio
 import logging
+import re
+from functools import lru_cache
 from typing import Optional, List, Dict, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import selectinload
 from app.external.ensembl import EnsemblClient
 from app.external.interpro import get_interpro_client
 from app.core.mapping.genomic_to_protein import GenomicToProteinMapper
 from app.models import Gene, Transcript, Protein, Domain, Fusion, Exon
-from app.schemas.fusion import FusionCreate, DomainInfo
-from datetime import datetime, timedelta
+from app.schemas.fusion import FusionCreate
+from datetime import datetime, timedelta, timezone
 
 logger = logging.getLogger(__name__)
 
 
-KINASE_KEYWORDS = ["kinase", "Kinase", "Pkinase", "TyrKc", "S_TKc", "STYKc"]
-CACHE_EXPIRY_DAYS = 30
+# Kinase domain names (Pfam Pkinase, SMART TyrKc/S_TKc/STYKc, free-text "kinase"),
+# matched case-insensitively
+KINASE_KEYWORDS = ["kinase", "Pkinase", "TyrKc", "S_TKc", "STYKc"]
+KINASE_RE = re.compile("|".join(re.escape(kw) for kw in KINASE_KEYWORDS), re.IGNORECASE)
+CACHE_EXPIRY_DAYS = 30  # since the gene was fetched from Ensembl
+CACHE_IDLE_EXPIRY_DAYS = 7  # since the cached gene was last used
+
+# Supporting reads (junction + spanning) per confidence level; "high" also
+# requires an in-frame fusion
+HIGH_CONFIDENCE_MIN_READS = 10
+MEDIUM_CONFIDENCE_MIN_READS = 5
+
+# Transcripts are loaded with their protein and its domains, which is all
+# the builder reads from them
+TRANSCRIPT_PROTEIN_LOAD = selectinload(Transcript.protein).selectinload(Protein.domains)
+
+# Indexed by retained * 2 + lost; a retained domain wins over the lost test
+DOMAIN_STATUS_BY_CODE = ("truncated", "lost", "retained", "retained")
+
+
+def domain_statuses(
+    spans: List[Tuple[Optional[int], Optional[int]]],
+    breakpoint: Optional[int],
+    position: str
+) -> List[str]:
+    """Determine if each (start, end) domain span is retained, truncated, or lost.
+
+    The 5'/3' branch is taken once per list; each span is then two
+    comparisons and a table lookup. Spans without coordinates are "unknown".
+    """
+    if breakpoint is None:
+        return ["unknown"] * len(spans)
+
+    if position == "5prime":
+        # For 5' gene, we keep everything before the breakpoint
+        return [
+            DOMAIN_STATUS_BY_CODE[(end <= breakpoint) * 2 + (start >= breakpoint)]
+            if start is not None and end is not None else "unknown"
+            for start, end in spans
+        ]
+    # For 3' gene, we keep everything after the breakpoint
+    return [
+        DOMAIN_STATUS_BY_CODE[(start >= breakpoint) * 2 + (end <= breakpoint)]
+        if start is not None and end is not None else "unknown"
+        for start, end in spans
+    ]
+
+
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime, the form cached_at columns store."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 
 # Normalize source/database names to consistent capitalization
 SOURCE_NAME_MAP = {
@@ -50,6 +105,7 @@ SOURCE_NAME_MAP = {
 }
 
 
+@lru_cache(maxsize=512)
 def normalize_source_name(source: str) -> str:
     """Normalize database/source names to consistent capitalization."""
     if not source:
@@ -69,76 +125,163 @@ class FusionBuilder:
         self.db = db
         self.ensembl = ensembl
         self.mapper = GenomicToProteinMapper(ensembl)
+        # Fixed per client; suffixes every composite ID the builder reads or writes
+        self._genome_build = ensembl.genome_build
+        # Lookups already resolved by this builder, reused across its fusions;
+        # genes are keyed by (symbol, genome_build) like the cached rows
+        self._gene_cache: Dict[Tuple[str, str], Gene] = {}
+        self._transcript_cache: Dict[Tuple[str, Optional[str]], Optional[Transcript]] = {}
+        # (transcript ID, genomic position, strand) -> amino acid position,
+        # mapped in bulk by prefetch
+        self._breakpoint_cache: Dict[Tuple[str, int, str], Optional[int]] = {}
 
     async def build_fusion(self, fusion_data: FusionCreate, session_id: str) -> Fusion:
-        """Build a complete fusion analysis from parsed input."""
+        """Build a complete fusion analysis from parsed input.
+
+        Cached gene data and the fusion record are written in one transaction;
+        on failure it is rolled back so nothing is left half-cached.
+        """
+        try:
+            fusion = await self._build_fusion(fusion_data, session_id)
+            await self.db.commit()
+        except Exception:
+            await self._rollback()
+            raise
+
+        await self.db.refresh(fusion)
+        return fusion
+
+    async def prefetch(self, fusions: List[FusionCreate]) -> None:
+        """Resolve the genes and transcripts of a batch of fusions up front.
+
+        Genes are fetched concurrently and each is committed once cached, so
+        the database is not held locked for the whole batch. The mapper gets
+        partner transcripts from their cached exons and CDS bounds, or from
+        Ensembl's bulk endpoint for any not stored, and the batch's breakpoints
+        are mapped per transcript in one pass, so the builds that follow
+        mostly hit the builder's caches. On failure the rest is skipped and
+        each build resolves its own partners.
+        """
+        symbols = [symbol for f in fusions for symbol in (f.gene_a_symbol, f.gene_b_symbol)]
+        try:
+            genes = dict(zip(symbols, await self._get_or_fetch_genes(*symbols, commit_each=True)))
+            await self.db.commit()
+        except Exception as e:
+            await self._rollback()
+            logger.warning(f"Prefetching genes for {len(fusions)} fusions failed: {e}")
+            return
+
+        try:
+            await self._prefetch_transcripts(fusions, genes)
+        except Exception as e:
+            await self._rollback()
+            logger.warning(f"Prefetching transcripts for {len(fusions)} fusions failed: {e}")
+
+    async def _prefetch_transcripts(
+        self, fusions: List[FusionCreate], genes: Dict[str, Optional[Gene]]
+    ) -> None:
+        """Hand the mapper the batch's partner transcripts ahead of the builds."""
+        partners = [
+            (symbol, transcript_id, position, strand)
+            for f in fusions
+            for symbol, transcript_id, position, strand in (
+                (f.gene_a_symbol, f.transcript_a_id, f.gene_a_breakpoint, f.gene_a_strand),
+                (f.gene_b_symbol, f.transcript_b_id, f.gene_b_breakpoint, f.gene_b_strand),
+            )
+        ]
+        partner_transcripts = await self._get_transcripts([
+            (genes[symbol], transcript_id) for symbol, transcript_id, _, _ in partners
+        ])
+        transcripts = list({t.id: t for t in partner_transcripts if t}.values())
+
+        # Transcripts cached with their CDS and exons need no Ensembl lookup
+        coding = [t.id for t in transcripts if t.cds_start and t.cds_end]
+        exons: Dict[str, List[Dict[str, int]]] = {}
+        if coding:
+            result = await self.db.execute(
+                select(Exon.transcript_id, Exon.start, Exon.end)
+                .where(Exon.transcript_id.in_(coding))
+            )
+            for transcript_id, start, end in result:
+                exons.setdefault(transcript_id, []).append({"start": start, "end": end})
+        for transcript in transcripts:
+            if transcript.id in exons:
+                self.mapper.seed_transcript(
+                    transcript.id, exons[transcript.id], transcript.cds_start, transcript.cds_end
+                )
+
+        await self.mapper.prefetch_transcripts([t.id for t in transcripts if t.id not in exons])
+
+        # Map the batch's breakpoints one transcript at a time, each in one pass
+        positions: Dict[Tuple[str, str], List[int]] = {}
+        for transcript, (_, _, position, strand) in zip(partner_transcripts, partners):
+            if transcript:
+                positions.setdefault((transcript.id, strand), []).append(position)
+        for (transcript_id, strand), transcript_positions in positions.items():
+            transcript_positions = list(dict.fromkeys(transcript_positions))
+            cds_positions = await self.mapper.map_breakpoints_bulk(
+                transcript_id, transcript_positions, strand
+            )
+            for position, cds_position in zip(transcript_positions, cds_positions):
+                self._breakpoint_cache[(transcript_id, position, strand)] = (
+                    None if cds_position is None else (cds_position - 1) // 3 + 1
+                )
+
+    async def _rollback(self) -> None:
+        """Roll back the session and forget what this builder resolved."""
+        await self.db.rollback()
+        # Rolled-back rows are expired or gone; don't hand them out again
+        self._gene_cache.clear()
+        self._transcript_cache.clear()
+
+    async def _build_fusion(self, fusion_data: FusionCreate, session_id: str) -> Fusion:
+        """Build and add the fusion record; the caller commits."""
         # Fetch/cache gene data
-        gene_a = await self._get_or_fetch_gene(fusion_data.gene_a_symbol)
-        gene_b = await self._get_or_fetch_gene(fusion_data.gene_b_symbol)
+        gene_a, gene_b = await self._get_or_fetch_genes(
+            fusion_data.gene_a_symbol, fusion_data.gene_b_symbol
+        )
 
         # Get transcripts
-        transcript_a = await self._get_transcript(
-            gene_a, fusion_data.transcript_a_id
-        ) if gene_a else None
-        transcript_b = await self._get_transcript(
-            gene_b, fusion_data.transcript_b_id
-        ) if gene_b else None
-
-        # Map breakpoints to amino acids
-        aa_breakpoint_a = None
-        aa_breakpoint_b = None
-
-        if transcript_a:
-            aa_breakpoint_a = await self.mapper.map_genomic_to_aa(
+        transcript_a, transcript_b = await self._get_transcripts([
+            (gene_a, fusion_data.transcript_a_id),
+            (gene_b, fusion_data.transcript_b_id),
+        ])
+
+        # Map breakpoints to amino acids and determine in-frame status
+        # (independent Ensembl lookups, run concurrently)
+        aa_breakpoint_a, aa_breakpoint_b, is_in_frame = await asyncio.gather(
+            self._map_breakpoint(
+                transcript_a,
                 fusion_data.gene_a_chromosome,
                 fusion_data.gene_a_breakpoint,
-                fusion_data.gene_a_strand,
-                transcript_a.id
-            )
-
-        if transcript_b:
-            aa_breakpoint_b = await self.mapper.map_genomic_to_aa(
+                fusion_data.gene_a_strand
+            ),
+            self._map_breakpoint(
+                transcript_b,
                 fusion_data.gene_b_chromosome,
                 fusion_data.gene_b_breakpoint,
-                fusion_data.gene_b_strand,
-                transcript_b.id
-            )
+                fusion_data.gene_b_strand
+            ),
+            self._determine_in_frame(fusion_data, transcript_a, transcript_b),
+        )
 
-        # Determine in-frame status
-        is_in_frame = None
-        if transcript_a and transcript_b:
-            logger.info(f"Calculating in-frame status for {fusion_data.gene_a_symbol}-{fusion_data.gene_b_symbol}")
-            logger.info(f"  Transcript A: {transcript_a.id}, breakpoint: {fusion_data.gene_a_breakpoint}, strand: {fusion_data.gene_a_strand}")
-            logger.info(f"  Transcript B: {transcript_b.id}, breakpoint: {fusion_data.gene_b_breakpoint}, strand: {fusion_data.gene_b_strand}")
-            is_in_frame = await self.mapper.is_in_frame_fusion(
-                fusion_data.gene_a_breakpoint,
-                fusion_data.gene_a_strand,
-                transcript_a.id,
-                fusion_data.gene_b_breakpoint,
-                fusion_data.gene_b_strand,
-                transcript_b.id
-            )
-            logger.info(f"  Result: is_in_frame={is_in_frame}")
-        else:
-            logger.warning(f"Cannot calculate in-frame: transcript_a={transcript_a}, transcript_b={transcript_b}")
+        # Proteins and their domains were loaded with the transcripts, and are
+        # used for both the domain statuses and the fusion sequence
+        protein_a = transcript_a.protein if transcript_a else None
+        protein_b = transcript_b.protein if transcript_b else None
 
         # Get protein domains
-        domains_a = await self._get_domains_with_status(
-            transcript_a, aa_breakpoint_a, "5prime"
-        ) if transcript_a else []
-
-        domains_b = await self._get_domains_with_status(
-            transcript_b, aa_breakpoint_b, "3prime"
-        ) if transcript_b else []
+        domains_a, kinase_statuses_a = self._get_domains_with_status(protein_a, aa_breakpoint_a, "5prime")
+        domains_b, kinase_statuses_b = self._get_domains_with_status(protein_b, aa_breakpoint_b, "3prime")
 
         # Build fusion sequence
-        fusion_sequence = await self._build_fusion_sequence(
-            transcript_a, aa_breakpoint_a,
-            transcript_b, aa_breakpoint_b
+        fusion_sequence = self._build_fusion_sequence(
+            protein_a, aa_breakpoint_a,
+            protein_b, aa_breakpoint_b
         )
 
         # Check for kinase domains
-        has_kinase, kinase_retained = self._check_kinase_domains(domains_a, domains_b)
+        has_kinase, kinase_retained = self._check_kinase_domains(kinase_statuses_a + kinase_statuses_b)
 
         # Calculate confidence
         confidence = self._calculate_confidence(
@@ -168,8 +311,8 @@ class FusionBuilder:
             aa_breakpoint_a=aa_breakpoint_a,
             aa_breakpoint_b=aa_breakpoint_b,
             fusion_sequence=fusion_sequence,
-            domains_a=[d.model_dump() for d in domains_a],
-            domains_b=[d.model_dump() for d in domains_b],
+            domains_a=domains_a,
+            domains_b=domains_b,
             has_kinase_domain=1 if has_kinase else 0,
             kinase_retained=1 if kinase_retained else (0 if kinase_retained is False else -1),
             confidence=confidence,
@@ -177,35 +320,90 @@ class FusionBuilder:
         )
 
         self.db.add(fusion)
-        await self.db.commit()
-        await self.db.refresh(fusion)
-
         return fusion
 
-    async def _get_or_fetch_gene(self, symbol: str) -> Optional[Gene]:
-        """Get gene from cache or fetch from Ensembl."""
-        genome_build = self.ensembl.genome_build
+    async def _get_or_fetch_genes(self, *symbols: str, commit_each: bool = False) -> List[Optional[Gene]]:
+        """Get genes from cache, fetching missing or stale ones from Ensembl.
+
+        Ensembl lookups for the genes run concurrently. The session cannot be
+        used concurrently, so cache reads and writes stay sequential. With
+        commit_each, the cache reads and then each cached gene are committed
+        on their own instead of being left to the caller's transaction.
+        """
+        genome_build = self._genome_build
+        genes: Dict[str, Optional[Gene]] = {}
+        to_fetch: List[str] = []
+        for symbol in dict.fromkeys(symbols):
+            if (symbol, genome_build) in self._gene_cache:
+                genes[symbol] = self._gene_cache[(symbol, genome_build)]
+                continue
+            genes[symbol] = await self._get_cached_gene(symbol)
+            if not genes[symbol]:
+                to_fetch.append(symbol)
+        if commit_each:
+            # Don't hold the access-time updates' write lock over the fetches
+            await self.db.commit()
+
+        fetched = await asyncio.gather(*(self._fetch_gene_data(symbol) for symbol in to_fetch))
+        for symbol, gene_data in zip(to_fetch, fetched):
+            if gene_data:
+                stale_gene = await self._get_stale_gene(symbol)
+                genes[symbol] = await self._cache_gene(symbol, gene_data, stale_gene)
+                if commit_each:
+                    await self.db.commit()
+
+        for symbol, gene in genes.items():
+            if gene:
+                self._gene_cache[(symbol, genome_build)] = gene
+
+        return [genes[symbol] for symbol in symbols]
+
+    async def _get_cached_gene(self, symbol: str) -> Optional[Gene]:
+        """Get a cached gene if it is still fresh.
+
+        A gene expires CACHE_EXPIRY_DAYS after it was fetched, or earlier if
+        it has not been used for CACHE_IDLE_EXPIRY_DAYS.
+        """
+        genome_build = self._genome_build
+        now = utcnow()
 
-        # Check cache - must match both symbol AND genome_build
+        # Check cache - must match both symbol AND genome_build; a stale row
+        # is filtered out by the (symbol, genome_build, cached_at) index
         result = await self.db.execute(
             select(Gene).where(
                 Gene.symbol == symbol,
-                Gene.genome_build == genome_build
+                Gene.genome_build == genome_build,
+                Gene.cached_at > now - timedelta(days=CACHE_EXPIRY_DAYS),
+                # Rows cached before last_accessed_at existed count from cached_at
+                func.coalesce(Gene.last_accessed_at, Gene.cached_at)
+                > now - timedelta(days=CACHE_IDLE_EXPIRY_DAYS)
             )
         )
         gene = result.scalar_one_or_none()
+        if gene:
+            logger.info(f"Using cached gene {symbol} for {genome_build}")
+            # Written with the rest of the build's transaction
+            gene.last_accessed_at = now
+        return gene
 
-        # Check if cache is fresh
-        if gene and gene.cached_at:
-            if datetime.utcnow() - gene.cached_at < timedelta(days=CACHE_EXPIRY_DAYS):
-                logger.info(f"Using cached gene {symbol} for {genome_build}")
-                return gene
+    async def _get_stale_gene(self, symbol: str) -> Optional[Gene]:
+        """Get the existing (expired) cache row for a gene that is being refreshed."""
+        result = await self.db.execute(
+            select(Gene).where(
+                Gene.symbol == symbol,
+                Gene.genome_build == self._genome_build
+            )
+        )
+        return result.scalar_one_or_none()
 
-        # Fetch from Ensembl
-        logger.info(f"Fetching gene {symbol} from Ensembl ({genome_build})")
-        gene_data = await self.ensembl.search_gene(symbol)
-        if not gene_data:
-            return None
+    async def _fetch_gene_data(self, symbol: str) -> Optional[Dict]:
+        """Fetch gene data (with transcripts) from Ensembl."""
+        logger.info(f"Fetching gene {symbol} from Ensembl ({self._genome_build})")
+        return await self.ensembl.search_gene(symbol)
+
+    async def _cache_gene(self, symbol: str, gene_data: Dict, gene: Optional[Gene]) -> Gene:
+        """Create or update a cached gene and its transcripts."""
+        genome_build = self._genome_build
 
         # Create or update cache
         # Use composite ID: gene_id + genome_build to allow same gene in different builds
@@ -221,14 +419,93 @@ class FusionBuilder:
         gene.strand = gene_data.get("strand")
         gene.biotype = gene_data.get("biotype")
         gene.genome_build = genome_build
-        gene.cached_at = datetime.utcnow()
+        # One timestamp for the gene and all of its cached rows
+        cached_at = utcnow()
+        gene.cached_at = cached_at
+        gene.last_accessed_at = cached_at
 
         self.db.add(gene)
-        await self.db.commit()
 
-        # Cache transcripts (pass gene symbol for InterPro domain lookup)
-        for trans_data in gene_data.get("Transcript", []):
-            await self._cache_transcript(gene.id, trans_data, gene.symbol)
+        transcripts_data = gene_data.get("Transcript", [])
+        translations = [
+            t["Translation"]
+            for t in transcripts_data
+            if t.get("Translation", {}).get("id")
+        ]
+        raw_protein_ids = [translation["id"] for translation in translations]
+
+        # Transcripts whose lookup lists fewer than 3 exons may be incomplete;
+        # their exons are fetched explicitly from the overlap endpoint
+        short_transcript_ids = [
+            f"{t['id']}_{genome_build}"
+            for t in transcripts_data
+            if len(t.get("Exon", [])) < 3
+        ]
+
+        # Fetch sequence, features and InterPro domains for all of the gene's
+        # proteins, and those exons, concurrently (the clients' semaphores
+        # bound the requests in flight)
+        fetched, fetched_exons = await asyncio.gather(
+            asyncio.gather(*(
+                self._fetch_protein_data(translation["id"], gene.symbol, translation.get("length"))
+                for translation in translations
+            )),
+            asyncio.gather(*(
+                self.ensembl.get_exons(transcript_id)
+                for transcript_id in short_transcript_ids
+            ))
+        )
+        protein_data = dict(zip(raw_protein_ids, fetched))
+        exon_data = dict(zip(short_transcript_ids, fetched_exons))
+
+        # Load already-cached transcripts and proteins in one query each
+        # rather than one SELECT per row
+        transcript_ids = [f"{t['id']}_{genome_build}" for t in transcripts_data]
+        protein_ids = [f"{pid}_{genome_build}" for pid in raw_protein_ids]
+        result = await self.db.execute(
+            select(Transcript).where(Transcript.id.in_(transcript_ids))
+        )
+        existing_transcripts = {t.id: t for t in result.scalars()}
+        result = await self.db.execute(
+            select(Protein).where(Protein.id.in_(protein_ids))
+        )
+        existing_proteins = {p.id: p for p in result.scalars()}
+
+        # Domains already stored for those proteins, by protein and position,
+        # for deduplicating the fetched ones
+        result = await self.db.execute(
+            select(Domain.protein_id, Domain.start, Domain.end, Domain.name, Domain.source)
+            .where(Domain.protein_id.in_(protein_ids))
+        )
+        existing_domains: Dict[str, Dict[Tuple[int, int], List[Tuple[Optional[str], Optional[str]]]]] = {}
+        for protein_id, start, end, name, source in result:
+            existing_domains.setdefault(protein_id, {}).setdefault((start, end), []).append((name, source))
+
+        # Cache transcripts (pass gene symbol for InterPro domain lookup).
+        # Their exon and domain rows are collected and written once per gene.
+        exon_rows: List[Dict] = []
+        domain_rows: List[Dict] = []
+        for trans_data in transcripts_data:
+            await self._cache_transcript(
+                gene.id, trans_data, gene.symbol,
+                existing_transcripts, existing_proteins, protein_data,
+                exon_data=exon_data, exon_rows=exon_rows, domain_rows=domain_rows,
+                existing_domains=existing_domains, cached_at=cached_at
+            )
+
+        if exon_rows:
+            # Existing (exon_id, transcript_id) rows are updated by ON CONFLICT
+            # rather than looked up first
+            stmt = sqlite_insert(Exon)
+            await self.db.execute(stmt.on_conflict_do_update(
+                index_elements=[Exon.exon_id, Exon.transcript_id],
+                set_={
+                    column: stmt.excluded[column]
+                    for column in ("rank", "start", "end", "phase", "end_phase", "cached_at")
+                }
+            ), exon_rows)
+        if domain_rows:
+            await self.db.execute(insert(Domain), domain_rows)
 
         return gene
 
@@ -236,17 +513,28 @@ class FusionBuilder:
         self,
         gene_id: str,
         trans_data: Dict,
-        gene_symbol: Optional[str] = None
+        gene_symbol: Optional[str] = None,
+        existing_transcripts: Optional[Dict[str, Transcript]] = None,
+        existing_proteins: Optional[Dict[str, Protein]] = None,
+        protein_data: Optional[Dict[str, Tuple[Optional[str], List[Dict], List[Dict]]]] = None,
+        *,
+        exon_rows: List[Dict],
+        domain_rows: List[Dict],
+        exon_data: Optional[Dict[str, List[Dict]]] = None,
+        existing_domains: Optional[Dict[str, Dict[Tuple[int, int], List]]] = None,
+        cached_at: Optional[datetime] = None
     ) -> Transcript:
-        """Cache a transcript and its related data."""
-        genome_build = self.ensembl.genome_build
+        """Cache a transcript and its related data.
+
+        The transcript and protein are added to the session; exon and domain
+        rows are always appended to `exon_rows` / `domain_rows` for the caller
+        to write. The caller commits.
+        """
+        genome_build = self._genome_build
         # Use composite ID: transcript_id + genome_build
         transcript_id = f"{trans_data['id']}_{genome_build}"
 
-        result = await self.db.execute(
-            select(Transcript).where(Transcript.id == transcript_id)
-        )
-        transcript = result.scalar_one_or_none()
+        transcript = (existing_transcripts or {}).get(transcript_id)
 
         if not transcript:
             transcript = Transcript(id=transcript_id)
@@ -256,7 +544,8 @@ class FusionBuilder:
         transcript.biotype = trans_data.get("biotype")
         transcript.start = trans_data.get("start")
         transcript.end = trans_data.get("end")
-        transcript.cached_at = datetime.utcnow()
+        cached_at = cached_at or utcnow()
+        transcript.cached_at = cached_at
 
         # Get CDS info
         if "Translation" in trans_data:
@@ -265,24 +554,27 @@ class FusionBuilder:
             transcript.cds_end = trans.get("end")
 
             # Cache protein with InterPro domains
-            await self._cache_protein(transcript.id, trans, gene_symbol)
+            await self._cache_protein(
+                transcript.id, trans, gene_symbol, existing_proteins,
+                (protein_data or {}).get(trans.get("id")),
+                domain_rows=domain_rows,
+                existing_domains=existing_domains,
+                cached_at=cached_at
+            )
 
         self.db.add(transcript)
-        await self.db.commit()
 
         # Cache exons - first try from trans_data, then fetch explicitly if needed
         exon_list = trans_data.get("Exon", [])
         logger.info(f"Transcript {transcript.id}: {len(exon_list)} exons from lookup")
 
-        # If no exons in the lookup response, fetch them explicitly via overlap endpoint
-        if not exon_list:
-            exon_list = await self.ensembl.get_exons(transcript.id)
-            logger.info(f"Transcript {transcript.id}: {len(exon_list)} exons from overlap endpoint")
-
-        # If we have exons from lookup but they might be incomplete,
-        # also fetch explicitly to get full data
-        if len(exon_list) < 3:  # Likely incomplete if only 1-2 exons
-            fetched_exons = await self.ensembl.get_exons(transcript.id)
+        # If the lookup response has no exons or might be incomplete (only 1-2),
+        # use the overlap endpoint's exons when it has more. _cache_gene
+        # prefetches them alongside the protein data.
+        if len(exon_list) < 3:
+            fetched_exons = (exon_data or {}).get(transcript.id)
+            if fetched_exons is None:
+                fetched_exons = await self.ensembl.get_exons(transcript.id)
             if len(fetched_exons) > len(exon_list):
                 exon_list = fetched_exons
                 logger.info(f"Transcript {transcript.id}: using {len(exon_list)} exons from overlap (more complete)")
@@ -324,67 +616,65 @@ class FusionBuilder:
         else:
             sorted_exons = sorted(exon_list, key=lambda e: e.get("start", 0))
 
-        for idx, exon_data in enumerate(sorted_exons):
-            # Assign rank if not present (1-based)
-            rank = exon_data.get("rank") or (idx + 1)
-            await self._cache_exon(transcript.id, exon_data, rank=rank)
+        exon_rows.extend(self._exon_rows(transcript.id, sorted_exons, cached_at))
 
         return transcript
 
-    async def _cache_exon(self, transcript_id: str, exon_data: Dict, rank: int = 0) -> Exon:
-        """Cache an exon.
+    def _exon_rows(
+        self,
+        transcript_id: str,
+        sorted_exons: List[Dict],
+        cached_at: datetime
+    ) -> List[Dict]:
+        """Build the exon rows to cache for a transcript.
 
         Uses composite key (exon_id, transcript_id) since the same exon
         can belong to multiple transcripts in Ensembl.
         """
-        exon_id = exon_data.get("id")
-        if not exon_id:
-            return None
-
-        # Check for existing exon with this composite key
-        result = await self.db.execute(
-            select(Exon).where(
-                Exon.exon_id == exon_id,
-                Exon.transcript_id == transcript_id
-            )
-        )
-        exon = result.scalar_one_or_none()
-
-        if not exon:
-            exon = Exon(exon_id=exon_id, transcript_id=transcript_id)
-
-        # Use provided rank, or from data, or default to 0
-        exon.rank = exon_data.get("rank") or rank or 0
-        exon.start = exon_data.get("start")
-        exon.end = exon_data.get("end")
-        exon.phase = exon_data.get("phase")
-        exon.end_phase = exon_data.get("end_phase")
-        exon.cached_at = datetime.utcnow()
-
-        self.db.add(exon)
-        await self.db.commit()
-
-        return exon
+        return [
+            {
+                "exon_id": exon_data["id"],
+                "transcript_id": transcript_id,
+                # Use rank from data, or assign by position (1-based)
+                "rank": exon_data.get("rank") or (idx + 1),
+                "start": exon_data.get("start"),
+                "end": exon_data.get("end"),
+                "phase": exon_data.get("phase"),
+                "end_phase": exon_data.get("end_phase"),
+                "cached_at": cached_at,
+            }
+            for idx, exon_data in enumerate(sorted_exons)
+            if exon_data.get("id")
+        ]
 
     async def _cache_protein(
         self,
         transcript_id: str,
         trans_data: Dict,
-        gene_symbol: Optional[str] = None
+        gene_symbol: Optional[str] = None,
+        existing_proteins: Optional[Dict[str, Protein]] = None,
+        fetched: Optional[Tuple[Optional[str], List[Dict], List[Dict]]] = None,
+        *,
+        domain_rows: List[Dict],
+        existing_domains: Optional[Dict[str, Dict[Tuple[int, int], List]]] = None,
+        cached_at: Optional[datetime] = None
     ) -> Optional[Protein]:
-        """Cache protein and its domains from multiple sources."""
+        """Cache protein and its domains from multiple sources.
+
+        `fetched` is the (sequence, features, InterPro domains) from _fetch_protein_data,
+        if the caller already fetched it. New domain rows are appended to
+        `domain_rows` for the caller to insert; `existing_domains` holds the
+        prefetched stored domains used to skip duplicates.
+        """
         raw_protein_id = trans_data.get("id")
         if not raw_protein_id:
             return None
 
         # Use composite protein ID with genome build to avoid conflicts
-        genome_build = self.ensembl.genome_build
+        genome_build = self._genome_build
         protein_id = f"{raw_protein_id}_{genome_build}"
 
-        result = await self.db.execute(
-            select(Protein).where(Protein.id == protein_id)
-        )
-        protein = result.scalar_one_or_none()
+        protein = (existing_proteins or {}).get(protein_id)
 
         if not protein:
             protein = Protein(id=protein_id)
@@ -392,228 +682,283 @@ class FusionBuilder:
         protein.transcript_id = transcript_id
         protein.length = trans_data.get("length")
 
-        # Fetch sequence (use raw ID for API call)
-        seq = await self.ensembl.get_protein_sequence(raw_protein_id)
+        # Fetch sequence and domains (use raw ID for API calls)
+        if fetched is None:
+            fetched = await self._fetch_protein_data(raw_protein_id, gene_symbol, protein.length)
+        seq, features, interpro_domains = fetched
         if seq:
             protein.sequence = seq
 
-        protein.cached_at = datetime.utcnow()
+        cached_at = cached_at or utcnow()
+        protein.cached_at = cached_at
 
         self.db.add(protein)
-        await self.db.commit()
-
-        # Fetch domains from Ensembl (use raw ID for API call, composite ID for storage)
-        features = await self.ensembl.get_protein_features(raw_protein_id)
-        for feat in features:
-            await self._cache_domain(protein_id, feat)
-
-        # Also fetch comprehensive domains from InterPro/UniProt
-        if gene_symbol:
-            try:
-                interpro_client = get_interpro_client()
-                interpro_domains = await interpro_client.get_comprehensive_domains(
-                    gene_symbol,
-                    protein_length=protein.length
-                )
-                for domain in interpro_domains:
-                    await self._cache_domain(protein_id, {
-                        "description": domain.get("name"),
-                        "type": domain.get("source", "InterPro"),
-                        "id": domain.get("accession"),
-                        "start": domain.get("start"),
-                        "end": domain.get("end"),
-                        "data_provider": domain.get("data_provider", "InterPro"),
-                    })
-                logger.info(f"Cached {len(interpro_domains)} InterPro domains for {gene_symbol}")
-            except Exception as e:
-                logger.warning(f"Failed to fetch InterPro domains for {gene_symbol}: {e}")
+
+        # Domains from Ensembl (composite ID for storage)
+        domain_features = list(features)
+
+        # Also comprehensive domains from InterPro/UniProt
+        for domain in interpro_domains:
+            domain_features.append({
+                "description": domain.get("name"),
+                "type": domain.get("source", "InterPro"),
+                "id": domain.get("accession"),
+                "start": domain.get("start"),
+                "end": domain.get("end"),
+                "data_provider": domain.get("data_provider", "InterPro"),
+            })
+
+        domain_rows.extend(self._domain_rows(
+            protein_id, domain_features,
+            (existing_domains or {}).get(protein_id, {}),
+            cached_at
+        ))
 
         return protein
 
-    async def _cache_domain(self, protein_id: str, feat_data: Dict) -> Optional[Domain]:
-        """Cache a protein domain with deduplication."""
-        name = feat_data.get("description", feat_data.get("type", "Unknown"))
-        start = feat_data.get("start")
-        end = feat_data.get("end")
-        raw_source = feat_data.get("type", "Unknown")
-        source = normalize_source_name(raw_source)
+    async def _fetch_protein_data(
+        self,
+        raw_protein_id: str,
+        gene_symbol: Optional[str] = None,
+        protein_length: Optional[int] = None
+    ) -> Tuple[Optional[str], List[Dict], List[Dict]]:
+        """Fetch a protein's sequence, Ensembl features and InterPro domains concurrently."""
+        seq, features, interpro_domains = await asyncio.gather(
+            self.ensembl.get_protein_sequence(raw_protein_id),
+            self.ensembl.get_protein_features(raw_protein_id),
+            self._fetch_interpro_domains(gene_symbol, protein_length)
+        )
+        return seq, features, interpro_domains
+
+    async def _fetch_interpro_domains(
+        self,
+        gene_symbol: Optional[str],
+        protein_length: Optional[int]
+    ) -> List[Dict]:
+        """Fetch comprehensive domains from InterPro/UniProt; failures yield no domains."""
+        if not gene_symbol:
+            return []
+        try:
+            interpro_client = get_interpro_client()
+            interpro_domains = await interpro_client.get_comprehensive_domains(
+                gene_symbol,
+                protein_length=protein_length
+            )
+            logger.info(f"Fetched {len(interpro_domains)} InterPro domains for {gene_symbol}")
+            return interpro_domains
+        except Exception as e:
+            logger.warning(f"Failed to fetch InterPro domains for {gene_symbol}: {e}")
+            return []
 
-        # Skip if missing required fields
-        if not start or not end:
+    def _domain_rows(
+        self,
+        protein_id: str,
+        features: List[Dict],
+        by_position: Dict[Tuple[int, int], List[Tuple[Optional[str], Optional[str]]]],
+        cached_at: datetime
+    ) -> List[Dict]:
+        """Build the new domain rows to cache for a protein, with deduplication.
+
+        `by_position` maps (start, end) to the (name, source) of the protein's
+        stored domains; new rows are added to it as they are accepted.
+        """
+        rows = []
+        for feat_data in features:
+            name = feat_data.get("description", feat_data.get("type", "Unknown"))
+            start = feat_data.get("start")
+            end = feat_data.get("end")
+            raw_source = feat_data.get("type", "Unknown")
+            source = normalize_source_name(raw_source)
+
+            # Skip if missing required fields
+            if not start or not end:
+                continue
+
+            # Check for duplicate (same position and similar name), including
+            # domains added earlier in this batch
+            at_position = by_position.setdefault((start, end), [])
+            if any(
+                # Skip if we have an exact name match
+                (d_name and name and d_name.lower() == name.lower())
+                # Skip if same source (normalize both for comparison)
+                or normalize_source_name(d_source or "") == source
+                for d_name, d_source in at_position
+            ):
+                continue
+            at_position.append((name, source))
+
+            rows.append({
+                "protein_id": protein_id,
+                "name": name,
+                "description": feat_data.get("description"),
+                "source": source,  # Use normalized source name
+                "accession": feat_data.get("id"),
+                "start": start,
+                "end": end,
+                "score": feat_data.get("score"),  # E-value or hit score
+                "data_provider": feat_data.get("data_provider", "Ensembl"),
+                "is_kinase": 1 if KINASE_RE.search(name or "") else 0,
+                "cached_at": cached_at,
+            })
+
+        return rows
+
+    async def _determine_in_frame(
+        self,
+        fusion_data: FusionCreate,
+        transcript_a: Optional[Transcript],
+        transcript_b: Optional[Transcript]
+    ) -> Optional[bool]:
+        """Determine whether the fusion is in frame, if both transcripts are known."""
+        if not transcript_a or not transcript_b:
+            logger.warning(f"Cannot calculate in-frame: transcript_a={transcript_a}, transcript_b={transcript_b}")
             return None
 
-        # Check for duplicate (same position and similar name)
-        result = await self.db.execute(
-            select(Domain).where(
-                Domain.protein_id == protein_id,
-                Domain.start == start,
-                Domain.end == end
-            )
-        )
-        existing = result.scalars().all()
-
-        # Check if we already have a domain at this position
-        for d in existing:
-            # Skip if we have an exact name match
-            if d.name and name and d.name.lower() == name.lower():
-                return d
-            # Skip if same source (normalize both for comparison)
-            if normalize_source_name(d.source or "") == source:
-                return d
-
-        domain = Domain(
-            protein_id=protein_id,
-            name=name,
-            description=feat_data.get("description"),
-            source=source,  # Use normalized source name
-            accession=feat_data.get("id"),
-            start=start,
-            end=end,
-            score=feat_data.get("score"),  # E-value or hit score
-            data_provider=feat_data.get("data_provider", "Ensembl"),
-            cached_at=datetime.utcnow()
+        logger.info(f"Calculating in-frame status for {fusion_data.gene_a_symbol}-{fusion_data.gene_b_symbol}")
+        logger.info(f"  Transcript A: {transcript_a.id}, breakpoint: {fusion_data.gene_a_breakpoint}, strand: {fusion_data.gene_a_strand}")
+        logger.info(f"  Transcript B: {transcript_b.id}, breakpoint: {fusion_data.gene_b_breakpoint}, strand: {fusion_data.gene_b_strand}")
+        is_in_frame = await self.mapper.is_in_frame_fusion(
+            fusion_data.gene_a_breakpoint,
+            fusion_data.gene_a_strand,
+            transcript_a.id,
+            fusion_data.gene_b_breakpoint,
+            fusion_data.gene_b_strand,
+            transcript_b.id
         )
+        logger.info(f"  Result: is_in_frame={is_in_frame}")
+        return is_in_frame
 
-        self.db.add(domain)
-        await self.db.commit()
-        return domain
+    async def _map_breakpoint(
+        self,
+        transcript: Optional[Transcript],
+        chromosome: str,
+        position: int,
+        strand: str
+    ) -> Optional[int]:
+        """Map a genomic breakpoint to an amino acid position on a transcript."""
+        if not transcript:
+            return None
+        key = (transcript.id, position, strand)
+        if key in self._breakpoint_cache:
+            return self._breakpoint_cache[key]
+        return await self.mapper.map_genomic_to_aa(chromosome, position, strand, transcript.id)
 
-    async def _get_transcript(
+    async def _get_transcripts(
         self,
-        gene: Gene,
-        transcript_id: Optional[str] = None
-    ) -> Optional[Transcript]:
-        """Get specific or canonical transcript."""
-        genome_build = self.ensembl.genome_build
-
-        if transcript_id:
-            # If user provided a transcript_id, convert to composite format
-            # Handle both formats: "ENST00000305877" and "ENST00000305877_hg38"
-            if "_hg" not in transcript_id:
-                composite_id = f"{transcript_id}_{genome_build}"
-            else:
-                composite_id = transcript_id
+        requests: List[Tuple[Optional[Gene], Optional[str]]]
+    ) -> List[Optional[Transcript]]:
+        """Get the specific or canonical transcript for each (gene, transcript_id).
 
+        Explicit transcript IDs are resolved with one IN query and canonical
+        lookups with another, plus one for genes without a canonical transcript.
+        Each transcript comes with its protein and domains eagerly loaded.
+        """
+        genome_build = self._genome_build
+        keys = [(gene.id, transcript_id or None) for gene, transcript_id in requests if gene]
+        missing = [key for key in dict.fromkeys(keys) if key not in self._transcript_cache]
+
+        # If user provided a transcript_id, convert to composite format
+        # Handle both formats: "ENST00000305877" and "ENST00000305877_hg38"
+        composite_ids = {
+            key: key[1] if "_hg" in key[1] else f"{key[1]}_{genome_build}"
+            for key in missing if key[1]
+        }
+        if composite_ids:
             result = await self.db.execute(
-                select(Transcript).where(Transcript.id == composite_id)
+                select(Transcript)
+                .options(TRANSCRIPT_PROTEIN_LOAD)
+                .where(Transcript.id.in_(composite_ids.values()))
             )
-            return result.scalar_one_or_none()
-
-        # Get canonical transcript
+            by_id = {t.id: t for t in result.scalars()}
+            for key, composite_id in composite_ids.items():
+                self._transcript_cache[key] = by_id.get(composite_id)
+
+        gene_ids = [gene_id for gene_id, transcript_id in missing if not transcript_id]
+        if gene_ids:
+            # Get canonical transcripts
+            by_gene = await self._first_transcript_per_gene(
+                gene_ids, Transcript.is_canonical == 1
+            )
+            fallback_ids = [gene_id for gene_id in gene_ids if gene_id not in by_gene]
+            if fallback_ids:
+                # Fall back to any protein-coding transcript
+                by_gene.update(await self._first_transcript_per_gene(
+                    fallback_ids, Transcript.biotype == "protein_coding"
+                ))
+            for gene_id in gene_ids:
+                self._transcript_cache[(gene_id, None)] = by_gene.get(gene_id)
+
+        return [
+            self._transcript_cache[(gene.id, transcript_id or None)] if gene else None
+            for gene, transcript_id in requests
+        ]
+
+    async def _first_transcript_per_gene(self, gene_ids: List[str], condition) -> Dict[str, Transcript]:
+        """Get the first transcript matching condition for each gene."""
         result = await self.db.execute(
             select(Transcript)
-            .where(Transcript.gene_id == gene.id)
-            .where(Transcript.is_canonical == 1)
+            .options(TRANSCRIPT_PROTEIN_LOAD)
+            .where(Transcript.gene_id.in_(gene_ids))
+            .where(condition)
         )
-        transcript = result.scalar_one_or_none()
+        by_gene: Dict[str, Transcript] = {}
+        for transcript in result.scalars():
+            by_gene.setdefault(transcript.gene_id, transcript)
+        return by_gene
 
-        if not transcript:
-            # Fall back to any protein-coding transcript
-            result = await self.db.execute(
-                select(Transcript)
-                .where(Transcript.gene_id == gene.id)
-                .where(Transcript.biotype == "protein_coding")
-            )
-            transcript = result.scalars().first()
-
-        return transcript
-
-    async def _get_domains_with_status(
+    def _get_domains_with_status(
         self,
-        transcript: Transcript,
+        protein: Optional[Protein],
         aa_breakpoint: Optional[int],
         position: str
-    ) -> List[DomainInfo]:
-        """Get domains with retention status."""
-        if not transcript:
-            return []
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Get domains with retention status, plus the statuses of the kinase domains.
 
-        # Get protein
-        result = await self.db.execute(
-            select(Protein).where(Protein.transcript_id == transcript.id)
-        )
-        protein = result.scalar_one_or_none()
+        Domains are returned as DomainInfo-shaped dicts, ready for the fusion's
+        JSON columns without building and dumping a model per domain.
+        """
         if not protein:
-            return []
+            return [], []
 
-        # Get domains
-        result = await self.db.execute(
-            select(Domain).where(Domain.protein_id == protein.id)
+        domains = protein.domains
+        statuses = domain_statuses(
+            [(domain.start, domain.end) for domain in domains], aa_breakpoint, position
         )
-        domains = result.scalars().all()
 
         domain_infos = []
-        for domain in domains:
-            status = self._determine_domain_status(
-                domain.start, domain.end, aa_breakpoint, position
-            )
-
-            is_kinase = any(kw in (domain.name or "") for kw in KINASE_KEYWORDS)
-
-            domain_infos.append(DomainInfo(
-                name=domain.name or "Unknown",
-                description=domain.description,
-                source=normalize_source_name(domain.source or "Unknown"),
-                accession=domain.accession,
-                start=domain.start or 0,
-                end=domain.end or 0,
-                score=domain.score,
-                status=status,
-                is_kinase=is_kinase
-            ))
-
-        return domain_infos
-
-    def _determine_domain_status(
-        self,
-        domain_start: int,
-        domain_end: int,
-        breakpoint: Optional[int],
-        position: str
-    ) -> str:
-        """Determine if a domain is retained, truncated, or lost."""
-        if breakpoint is None:
-            return "unknown"
-
-        if position == "5prime":
-            # For 5' gene, we keep everything before the breakpoint
-            if domain_end <= breakpoint:
-                return "retained"
-            elif domain_start >= breakpoint:
-                return "lost"
-            else:
-                return "truncated"
-        else:
-            # For 3' gene, we keep everything after the breakpoint
-            if domain_start >= breakpoint:
-                return "retained"
-            elif domain_end <= breakpoint:
-                return "lost"
+        kinase_statuses = []
+        for domain, status in zip(domains, statuses):
+            if domain.is_kinase is not None:
+                is_kinase = bool(domain.is_kinase)
             else:
-                return "truncated"
-
-    async def _build_fusion_sequence(
+                # Cached before is_kinase was stored
+                is_kinase = bool(KINASE_RE.search(domain.name or ""))
+            if is_kinase:
+                kinase_statuses.append(status)
+
+            domain_infos.append({
+                "name": domain.name or "Unknown",
+                "description": domain.description,
+                "source": normalize_source_name(domain.source or "Unknown"),
+                "accession": domain.accession,
+                "start": domain.start or 0,
+                "end": domain.end or 0,
+                "score": domain.score,
+                "status": status,
+                "is_kinase": is_kinase,
+                "data_provider": None,  # DomainInfo field, not filled in by the builder
+            })
+
+        return domain_infos, kinase_statuses
+
+    def _build_fusion_sequence(
         self,
-        transcript_a: Optional[Transcript],
+        protein_a: Optional[Protein],
         aa_breakpoint_a: Optional[int],
-        transcript_b: Optional[Transcript],
+        protein_b: Optional[Protein],
         aa_breakpoint_b: Optional[int]
     ) -> Optional[str]:
         """Build the fusion protein sequence."""
-        if not transcript_a or not transcript_b:
-            return None
-
-        # Get proteins
-        result_a = await self.db.execute(
-            select(Protein).where(Protein.transcript_id == transcript_a.id)
-        )
-        protein_a = result_a.scalar_one_or_none()
-
-        result_b = await self.db.execute(
-            select(Protein).where(Protein.transcript_id == transcript_b.id)
-        )
-        protein_b = result_b.scalar_one_or_none()
-
         if not protein_a or not protein_b:
             return None
 
@@ -623,42 +968,32 @@ class FusionBuilder:
         if not seq_a or not seq_b:
             return None
 
-        # Truncate and join sequences
-        if aa_breakpoint_a and aa_breakpoint_a <= len(seq_a):
-            seq_a_part = seq_a[:aa_breakpoint_a]
-        else:
-            seq_a_part = seq_a
+        # Truncate and join sequences; a breakpoint outside the sequence keeps
+        # it whole (a full slice returns the string itself, no copy)
+        end_a = aa_breakpoint_a if aa_breakpoint_a and aa_breakpoint_a <= len(seq_a) else None
+        start_b = aa_breakpoint_b - 1 if aa_breakpoint_b and aa_breakpoint_b <= len(seq_b) else 0
 
-        if aa_breakpoint_b and aa_breakpoint_b <= len(seq_b):
-            seq_b_part = seq_b[aa_breakpoint_b - 1:]
-        else:
-            seq_b_part = seq_b
+        return "".join((seq_a[:end_a], seq_b[start_b:]))
 
-        return seq_a_part + seq_b_part
+    @staticmethod
+    def _check_kinase_domains(kinase_statuses: List[str]) -> Tuple[bool, Optional[bool]]:
+        """Check if fusion has kinase domain and if it's retained.
 
-    def _check_kinase_domains(
-        self,
-        domains_a: List[DomainInfo],
-        domains_b: List[DomainInfo]
-    ) -> Tuple[bool, Optional[bool]]:
-        """Check if fusion has kinase domain and if it's retained."""
-        has_kinase = False
-        kinase_retained = None
-
-        for domain in domains_a + domains_b:
-            if domain.is_kinase:
-                has_kinase = True
-                if domain.status == "retained":
-                    kinase_retained = True
-                elif domain.status == "lost" and kinase_retained is None:
-                    kinase_retained = False
-                elif domain.status == "truncated":
-                    kinase_retained = False
-
-        return has_kinase, kinase_retained
+        kinase_statuses are the statuses of the kinase domains of both
+        partners. Any retained kinase domain means the kinase is retained;
+        otherwise a truncated or lost one means it is not.
+        """
+        if not kinase_statuses:
+            return False, None
 
+        if "retained" in kinase_statuses:
+            return True, True
+        if "truncated" in kinase_statuses or "lost" in kinase_statuses:
+            return True, False
+        return True, None
+
+    @staticmethod
     def _calculate_confidence(
-        self,
         junction_reads: Optional[int],
         spanning_reads: Optional[int],
         is_in_frame: Optional[bool]
@@ -666,9 +1001,9 @@ class FusionBuilder:
         """Calculate confidence level."""
         total_reads = (junction_reads or 0) + (spanning_reads or 0)
 
-        if total_reads >= 10 and is_in_frame:
+        if total_reads >= HIGH_CONFIDENCE_MIN_READS and is_in_frame:
             return "high"
-        elif total_reads >= 5:
+        elif total_reads >= MEDIUM_CONFIDENCE_MIN_READS:
             return "medium"
         else:
             return "low"
@@ -1,15 +1,119 @@
+import asyncio
 import logging
+import math
+from bisect import bisect_left, bisect_right
 from typing import Optional, List, Dict, Any, Tuple
-from app.external.ensembl import EnsemblClient
+from app.external.ensembl import EnsemblClient, BULK_LOOKUP_MAX_IDS
 
 logger = logging.getLogger(__name__)
 
 
+class ExonIndex:
+    """Coding spans of a transcript's exons, in transcription order, for bisect lookups.
+
+    Minus-strand coordinates are negated, so exons are always walked from low
+    to high and one set of comparisons serves both strands. Per coding exon it
+    keeps the coding span, the CDS length before it, and the end of the
+    preceding exon when that exon reaches into the CDS (for intronic positions).
+    """
+
+    __slots__ = ("sign", "cds_start", "cds_end", "starts", "ends", "max_ends", "cds_before",
+                 "prev_ends", "min_prev_ends", "total_cds")
+
+    def __init__(self, exons: List[Dict], cds_start: int, cds_end: int, negative_strand: bool):
+        self.sign = -1 if negative_strand else 1
+        # Oriented CDS bounds
+        lo, hi = (-cds_end, -cds_start) if negative_strand else (cds_start, cds_end)
+        self.cds_start = lo
+        self.cds_end = hi
+
+        # (start, end) per exon in walking order
+        spans = [
+            (-e["end"], -e["start"]) if negative_strand else (e["start"], e["end"])
+            for e in sorted(exons, key=lambda e: -e["end"] if negative_strand else e["start"])
+        ]
+
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        self.max_ends: List[int] = []
+        self.cds_before: List[int] = []
+        self.prev_ends: List[float] = []
+        total = 0
+        for i, (start, end) in enumerate(spans):
+            coding_start = max(start, lo)
+            coding_end = min(end, hi)
+            if coding_start > coding_end:
+                continue  # No coding region in this exon
+            prev_end = spans[i - 1][1] if i > 0 else None
+            self.starts.append(coding_start)
+            self.ends.append(coding_end)
+            self.max_ends.append(max(coding_end, self.max_ends[-1]) if self.max_ends else coding_end)
+            self.cds_before.append(total)
+            self.prev_ends.append(
+                prev_end if prev_end is not None and prev_end >= lo and hi >= lo else math.inf
+            )
+            total += coding_end - coding_start + 1
+        self.total_cds = total
+
+        # min_prev_ends[k] is the smallest prev_end from coding exon k onwards
+        self.min_prev_ends = self.prev_ends[:]
+        for k in range(len(self.min_prev_ends) - 2, -1, -1):
+            self.min_prev_ends[k] = min(self.min_prev_ends[k], self.min_prev_ends[k + 1])
+
+    def cds_position(self, genomic_pos: int) -> Optional[int]:
+        """CDS position (1-based) of a genomic position.
+
+        An intronic position maps to the CDS position at the end of the exon
+        before it, and a position past the CDS to the last CDS position.
+        """
+        pos = genomic_pos * self.sign
+        # Outside the CDS: UTR, or introns flanking it
+        if pos < self.cds_start:
+            return None
+        if pos > self.cds_end:
+            return self.total_cds or None
+
+        # Coding exons starting at or before pos are [0, upto)
+        upto = bisect_right(self.starts, pos)
+        # First of them reaching pos, if any, contains it
+        k = bisect_left(self.max_ends, pos)
+        if k < upto:
+            return self.cds_before[k] + pos - self.starts[k] + 1
+
+        # In the intron before a later coding exon
+        if upto < len(self.starts) and self.min_prev_ends[upto] < pos:
+            for k in range(upto, len(self.starts)):
+                if self.prev_ends[k] < pos:
+                    logger.debug("Intronic position %s mapped to exon boundary at CDS pos %s", genomic_pos, self.cds_before[k])
+                    return self.cds_before[k]
+
+        return None
+
+    def cds_length_before(self, genomic_pos: int) -> int:
+        """CDS length before a genomic position, walking in index order.
+
+        A position in an exon counts up to and including itself.
+        """
+        pos = genomic_pos * self.sign
+        if pos < self.cds_start:
+            return 0
+        if pos > self.cds_end:
+            return self.total_cds
+        k = bisect_left(self.max_ends, pos)
+        if k == len(self.starts):
+            return self.total_cds
+        return self.cds_before[k] + max(0, pos - self.starts[k] + 1)
+
+
 class GenomicToProteinMapper:
     """Maps genomic coordinates to protein/amino acid positions."""
 
     def __init__(self, ensembl_client: EnsemblClient):
         self.ensembl = ensembl_client
+        # Ensembl transcript lookups by stable ID, fetched once per mapper
+        self._transcripts: Dict[str, "asyncio.Future[Optional[Dict[str, Any]]]"] = {}
+        # Exon indexes by (Ensembl ID, minus strand), built once per transcript
+        self._exon_indexes: Dict[Tuple[str, bool], ExonIndex] = {}
 
     def _strip_genome_suffix(self, transcript_id: str) -> str:
         """Strip genome build suffix from composite ID (e.g., 'ENST00000305877_hg38' -> 'ENST00000305877')."""
@@ -17,6 +121,72 @@ class GenomicToProteinMapper:
             return transcript_id.rsplit("_", 1)[0]
         return transcript_id
 
+    async def _get_transcript(self, transcript_id: str) -> Optional[Dict[str, Any]]:
+        """Get a transcript with exons from Ensembl, fetching it once per mapper.
+
+        Concurrent lookups of the same transcript share one request; a failed
+        lookup is not kept, so the next call retries it.
+        """
+        ensembl_id = self._strip_genome_suffix(transcript_id)
+        lookup = self._transcripts.get(ensembl_id)
+        if lookup is None:
+            lookup = asyncio.ensure_future(self.ensembl.get_transcript(ensembl_id))
+            self._transcripts[ensembl_id] = lookup
+        try:
+            return await asyncio.shield(lookup)
+        except Exception:
+            if self._transcripts.get(ensembl_id) is lookup:
+                del self._transcripts[ensembl_id]
+            raise
+
+    def seed_transcript(
+        self,
+        transcript_id: str,
+        exons: List[Dict[str, int]],
+        cds_start: int,
+        cds_end: int
+    ) -> None:
+        """Use locally cached exons and CDS bounds instead of an Ensembl lookup.
+
+        Only the fields the mapper reads are kept. Transcripts already fetched
+        or seeded are left as they are.
+        """
+        ensembl_id = self._strip_genome_suffix(transcript_id)
+        if ensembl_id in self._transcripts:
+            return
+        lookup = asyncio.get_running_loop().create_future()
+        lookup.set_result({
+            "id": ensembl_id,
+            "Exon": exons,
+            "Translation": {"start": cds_start, "end": cds_end},
+        })
+        self._transcripts[ensembl_id] = lookup
+
+    async def prefetch_transcripts(self, transcript_ids: List[str]) -> None:
+        """Look up transcripts with Ensembl's bulk endpoint ahead of mapping.
+
+        Transcripts already fetched are skipped. If a bulk request fails, its
+        transcripts are left to be fetched one by one when mapped.
+        """
+        ensembl_ids = [
+            ensembl_id
+            for ensembl_id in dict.fromkeys(self._strip_genome_suffix(tid) for tid in transcript_ids)
+            if ensembl_id not in self._transcripts
+        ]
+        for i in range(0, len(ensembl_ids), BULK_LOOKUP_MAX_IDS):
+            chunk = ensembl_ids[i:i + BULK_LOOKUP_MAX_IDS]
+            try:
+                found = await self.ensembl.get_transcripts_bulk(chunk)
+            except Exception as e:
+                logger.warning("Bulk transcript lookup failed for %d transcripts: %s", len(chunk), e)
+                continue
+            loop = asyncio.get_running_loop()
+            for ensembl_id in chunk:
+                if ensembl_id not in self._transcripts:
+                    lookup = loop.create_future()
+                    lookup.set_result(found.get(ensembl_id))
+                    self._transcripts[ensembl_id] = lookup
+
     async def map_genomic_to_aa(
         self,
         chromosome: str,
@@ -36,18 +206,63 @@ class GenomicToProteinMapper:
         Returns:
             Amino acid position (1-based) or None if not in coding region
         """
-        # Get transcript with exons (strip composite ID suffix if present)
-        ensembl_id = self._strip_genome_suffix(transcript_id)
-        transcript = await self.ensembl.get_transcript(ensembl_id)
+        cds_position = await self._get_cds_position(position, strand, transcript_id)
+        if cds_position is None:
+            return None
+
+        # Convert CDS position to amino acid position
+        aa_position = (cds_position - 1) // 3 + 1
+        return aa_position
+
+    async def _get_cds_position(
+        self,
+        position: int,
+        strand: str,
+        transcript_id: str
+    ) -> Optional[int]:
+        """CDS position (1-based) of a genomic position, or None if not in coding region."""
+        index = await self._get_cds_index(transcript_id, strand)
+        if index is None:
+            return None
+
+        cds_position = index.cds_position(position)
+        if cds_position is None or cds_position < 1:
+            return None
+        return cds_position
+
+    async def map_breakpoints_bulk(
+        self,
+        transcript_id: str,
+        positions: List[int],
+        strand: str
+    ) -> List[Optional[int]]:
+        """
+        Map many genomic positions on one transcript to CDS positions.
+
+        The transcript is looked up and indexed once for the whole batch.
+
+        Returns:
+            CDS position (1-based) per input position, None where not in coding region
+        """
+        index = await self._get_cds_index(transcript_id, strand)
+        if index is None:
+            return [None] * len(positions)
+
+        cds_position = index.cds_position
+        results: List[Optional[int]] = []
+        for position in positions:
+            cds_pos = cds_position(position)
+            results.append(cds_pos if cds_pos is not None and cds_pos >= 1 else None)
+        return results
+
+    async def _get_cds_index(self, transcript_id: str, strand: str) -> Optional[ExonIndex]:
+        """Get the exon index for a transcript's CDS, or None if it has no usable CDS."""
+        # Get transcript with exons (composite ID suffix is stripped)
+        transcript = await self._get_transcript(transcript_id)
         if not transcript:
             return None
 
-        # Get exons sorted by rank
-        exons = sorted(
-            transcript.get("Exon", []),
-            key=lambda e: e.get("rank", 0)
-        )
-        if not exons:
+        if not transcript.get("Exon"):
             return None
 
         # Get CDS info
@@ -61,90 +276,23 @@ class GenomicToProteinMapper:
         if not cds_start or not cds_end:
             return None
 
-        # Calculate CDS position
-        cds_position = self._calculate_cds_position(
-            position, strand, exons, cds_start, cds_end
-        )
-
-        if cds_position is None or cds_position < 1:
-            return None
+        return self._exon_index(transcript_id, transcript, cds_start, cds_end, strand == "-")
 
-        # Convert CDS position to amino acid position
-        aa_position = (cds_position - 1) // 3 + 1
-        return aa_position
-
-    def _calculate_cds_position(
+    def _exon_index(
         self,
-        genomic_pos: int,
-        strand: str,
-        exons: List[Dict],
+        transcript_id: str,
+        transcript: Dict[str, Any],
         cds_start: int,
-        cds_end: int
-    ) -> Optional[int]:
-        """Calculate CDS position from genomic position.
-
-        For intronic positions, returns the CDS position at the nearest exon boundary.
-        """
-        cds_position = 0
-        is_negative_strand = strand == "-"
-
-        # Sort exons by genomic position
-        sorted_exons = sorted(exons, key=lambda e: e["start"])
-        if is_negative_strand:
-            sorted_exons = sorted(exons, key=lambda e: e["end"], reverse=True)
-
-        prev_coding_end_pos = 0  # Track CDS position at end of previous exon
-
-        for i, exon in enumerate(sorted_exons):
-            exon_start = exon["start"]
-            exon_end = exon["end"]
-
-            # Determine coding portion of this exon
-            coding_start = max(exon_start, cds_start)
-            coding_end = min(exon_end, cds_end)
-
-            if coding_start > coding_end:
-                continue  # No coding region in this exon
-
-            # Check if position falls within this exon's coding region
-            if coding_start <= genomic_pos <= coding_end:
-                if is_negative_strand:
-                    position_in_exon = coding_end - genomic_pos
-                else:
-                    position_in_exon = genomic_pos - coding_start
-                return cds_position + position_in_exon + 1
-
-            # Check if position is in intron BEFORE this exon (for + strand)
-            # or AFTER this exon (for - strand)
-            if not is_negative_strand:
-                if i > 0 and genomic_pos < coding_start:
-                    # Position is in intron before this exon - use end of previous exon
-                    prev_exon = sorted_exons[i - 1]
-                    prev_coding_end = min(prev_exon["end"], cds_end)
-                    if prev_coding_end >= cds_start and genomic_pos > prev_exon["end"]:
-                        logger.debug(f"Intronic position {genomic_pos} mapped to exon boundary at CDS pos {prev_coding_end_pos}")
-                        return prev_coding_end_pos
-            else:
-                if i > 0 and genomic_pos > coding_end:
-                    # For negative strand, position after this exon
-                    prev_exon = sorted_exons[i - 1]
-                    prev_coding_start = max(prev_exon["start"], cds_start)
-                    if prev_coding_start <= cds_end and genomic_pos < prev_exon["start"]:
-                        logger.debug(f"Intronic position {genomic_pos} mapped to exon boundary at CDS pos {prev_coding_end_pos}")
-                        return prev_coding_end_pos
-
-            # Add this exon's coding length to running total
-            coding_length = coding_end - coding_start + 1
-            cds_position += coding_length
-            prev_coding_end_pos = cds_position
-
-        # If position is after all exons, return the last CDS position
-        if prev_coding_end_pos > 0:
-            if (not is_negative_strand and genomic_pos > cds_end) or \
-               (is_negative_strand and genomic_pos < cds_start):
-                return prev_coding_end_pos
-
-        return None
+        cds_end: int,
+        negative_strand: bool
+    ) -> ExonIndex:
+        """Get a transcript's exon index for one walking direction, building it once."""
+        key = (self._strip_genome_suffix(transcript_id), negative_strand)
+        index = self._exon_indexes.get(key)
+        if index is None:
+            index = ExonIndex(transcript.get("Exon", []), cds_start, cds_end, negative_strand)
+            self._exon_indexes[key] = index
+        return index
 
     async def get_exon_at_position(
         self,
@@ -152,8 +300,7 @@ class GenomicToProteinMapper:
         transcript_id: str
     ) -> Optional[Dict[str, Any]]:
         """Get the exon containing a genomic position."""
-        ensembl_id = self._strip_genome_suffix(transcript_id)
-        transcript = await self.ensembl.get_transcript(ensembl_id)
+        transcript = await self._get_transcript(transcript_id)
         if not transcript:
             return None
 
@@ -174,43 +321,15 @@ class GenomicToProteinMapper:
         Returns:
             0, 1, or 2 indicating the codon phase, or None if not in CDS
         """
-        aa_pos = await self.map_genomic_to_aa(
-            "", position, strand, transcript_id
-        )
-        if aa_pos is None:
-            logger.debug(f"calculate_frame: aa_pos is None for {transcript_id} at position {position}")
-            return None
-
-        ensembl_id = self._strip_genome_suffix(transcript_id)
-        transcript = await self.ensembl.get_transcript(ensembl_id)
-        if not transcript:
-            logger.warning(f"calculate_frame: transcript not found for {transcript_id}")
-            return None
-
-        translation = transcript.get("Translation", {})
-        if not translation:
-            logger.warning(f"calculate_frame: no Translation data for {transcript_id}")
-            return None
-
-        cds_start = translation.get("start")
-        cds_end = translation.get("end")
-
-        logger.debug(f"calculate_frame: {transcript_id} CDS range: {cds_start}-{cds_end}, position: {position}")
-
-        # Calculate CDS position
-        cds_pos = self._calculate_cds_position(
-            position, strand,
-            transcript.get("Exon", []),
-            cds_start, cds_end
-        )
-
+        # The same CDS position the amino acid mapping uses
+        cds_pos = await self._get_cds_position(position, strand, transcript_id)
         if cds_pos is None:
-            logger.debug(f"calculate_frame: cds_pos is None (breakpoint {position} outside CDS {cds_start}-{cds_end})")
+            logger.debug("calculate_frame: no CDS position for %s at position %s", transcript_id, position)
             return None
 
         # Frame is position modulo 3
         frame = (cds_pos - 1) % 3
-        logger.debug(f"calculate_frame: cds_pos={cds_pos}, frame={frame}")
+        logger.debug("calculate_frame: cds_pos=%s, frame=%s", cds_pos, frame)
         return frame
 
     async def is_in_frame_fusion(
@@ -229,20 +348,21 @@ class GenomicToProteinMapper:
         1. Both CDS lengths (5' up to breakpoint, 3' from breakpoint) are divisible by 3, OR
         2. The remainders when divided by 3 sum to 3 (complementary frames)
         """
-        # Get CDS length for 5' partner (from start to breakpoint)
-        cds_len_5prime = await self._get_cds_length_to_breakpoint(
-            transcript_a, breakpoint_a, strand_a, is_5prime=True
-        )
-
-        # Get CDS length for 3' partner (from breakpoint to end)
-        cds_len_3prime = await self._get_cds_length_to_breakpoint(
-            transcript_b, breakpoint_b, strand_b, is_5prime=False
+        # CDS length for 5' partner (from start to breakpoint) and 3' partner
+        # (from breakpoint to end); the transcript lookups run concurrently
+        cds_len_5prime, cds_len_3prime = await asyncio.gather(
+            self._get_cds_length_to_breakpoint(
+                transcript_a, breakpoint_a, strand_a, is_5prime=True
+            ),
+            self._get_cds_length_to_breakpoint(
+                transcript_b, breakpoint_b, strand_b, is_5prime=False
+            ),
         )
 
-        logger.info(f"is_in_frame_fusion: cds_len_5prime={cds_len_5prime}, cds_len_3prime={cds_len_3prime}")
+        logger.info("is_in_frame_fusion: cds_len_5prime=%s, cds_len_3prime=%s", cds_len_5prime, cds_len_3prime)
 
         if cds_len_5prime is None or cds_len_3prime is None:
-            logger.warning(f"is_in_frame_fusion: Cannot determine CDS lengths")
+            logger.warning("is_in_frame_fusion: Cannot determine CDS lengths")
             return None
 
         # Check frame compatibility (AGFusion algorithm)
@@ -251,15 +371,18 @@ class GenomicToProteinMapper:
 
         # In-frame if both are divisible by 3
         if remainder_5 == 0 and remainder_3 == 0:
-            logger.info(f"is_in_frame_fusion: Both divisible by 3 -> in-frame")
+            logger.info("is_in_frame_fusion: Both divisible by 3 -> in-frame")
             return True
 
         # In-frame (with junction mutation) if remainders sum to 3
         if remainder_5 + remainder_3 == 3:
-            logger.info(f"is_in_frame_fusion: Remainders {remainder_5}+{remainder_3}=3 -> in-frame (with mutation)")
+            logger.info("is_in_frame_fusion: Remainders %s+%s=3 -> in-frame (with mutation)", remainder_5, remainder_3)
             return True
 
-        logger.info(f"is_in_frame_fusion: Remainders {remainder_5}+{remainder_3}={remainder_5+remainder_3} -> out-of-frame")
+        logger.info(
+            "is_in_frame_fusion: Remainders %s+%s=%s -> out-of-frame",
+            remainder_5, remainder_3, remainder_5 + remainder_3
+        )
         return False
 
     async def _get_cds_length_to_breakpoint(
@@ -280,15 +403,14 @@ class GenomicToProteinMapper:
         2. Calculate CDS length before breakpoint in genomic direction
         3. Apply strand conversion ONCE at the end
         """
-        ensembl_id = self._strip_genome_suffix(transcript_id)
-        transcript = await self.ensembl.get_transcript(ensembl_id)
+        transcript = await self._get_transcript(transcript_id)
         if not transcript:
-            logger.warning(f"_get_cds_length: transcript not found for {transcript_id}")
+            logger.warning("_get_cds_length: transcript not found for %s", transcript_id)
             return None
 
         translation = transcript.get("Translation", {})
         if not translation:
-            logger.warning(f"_get_cds_length: no Translation for {transcript_id}")
+            logger.warning("_get_cds_length: no Translation for %s", transcript_id)
             return None
 
         cds_start = translation.get("start")
@@ -300,45 +422,11 @@ class GenomicToProteinMapper:
 
         is_negative_strand = strand == "-"
 
-        # Always sort exons in genomic order (low-to-high coordinates)
-        sorted_exons = sorted(exons, key=lambda e: e["start"])
-
-        # Calculate CDS length and find where breakpoint falls
-        total_cds_length = 0
-        cds_before_breakpoint_genomic = 0  # In genomic (5'->3' of + strand) direction
-        breakpoint_found = False
-
-        for exon in sorted_exons:
-            exon_start = exon["start"]
-            exon_end = exon["end"]
-
-            # Determine coding portion of this exon
-            coding_start = max(exon_start, cds_start)
-            coding_end = min(exon_end, cds_end)
-
-            if coding_start > coding_end:
-                continue  # No coding region in this exon
-
-            coding_length = coding_end - coding_start + 1
-
-            if not breakpoint_found:
-                if breakpoint < coding_start:
-                    # Breakpoint is before this exon (in upstream intron or UTR)
-                    breakpoint_found = True
-                elif breakpoint <= coding_end:
-                    # Breakpoint is within this exon
-                    # Simple genomic calculation - no strand logic here
-                    cds_before_breakpoint_genomic += breakpoint - coding_start + 1
-                    breakpoint_found = True
-                else:
-                    # Breakpoint is after this exon, include full exon
-                    cds_before_breakpoint_genomic += coding_length
-
-            total_cds_length += coding_length
-
-        # Handle breakpoint after all exons
-        if not breakpoint_found:
-            cds_before_breakpoint_genomic = total_cds_length
+        # CDS length before the breakpoint, walking exons in genomic order
+        # (low-to-high coordinates) whatever the strand
+        index = self._exon_index(transcript_id, transcript, cds_start, cds_end, False)
+        total_cds_length = index.total_cds
+        cds_before_breakpoint_genomic = index.cds_length_before(breakpoint)  # In genomic (5'->3' of + strand) direction
 
         # Convert from genomic to transcription direction (ONLY ONCE)
         if is_negative_strand:
@@ -354,5 +442,8 @@ class GenomicToProteinMapper:
             # 3' gene: return CDS length from breakpoint to end
             result = total_cds_length - cds_before_breakpoint
 
-        logger.debug(f"_get_cds_length: {transcript_id} breakpoint={breakpoint} is_5prime={is_5prime} total_cds={total_cds_length} genomic_before={cds_before_breakpoint_genomic} -> {result}")
+        logger.debug(
+            "_get_cds_length: %s breakpoint=%s is_5prime=%s total_cds=%s genomic_before=%s -> %s",
+            transcript_id, breakpoint, is_5prime, total_cds_length, cds_before_breakpoint_genomic, result
+        )
         return result
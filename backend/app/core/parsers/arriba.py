@@ -1,3 +1,4 @@
+from operator import itemgetter
 from typing import List
 from app.core.parsers.base import BaseFusionParser
 from app.schemas.fusion import FusionCreate
@@ -15,22 +16,29 @@ class ArribaParser(BaseFusionParser):
         site1 site2 type direction split_reads1 split_reads2 discordant_mates ...
         """
         fusions = []
-        lines = content.strip().split("\n")
-
-        # Find header line
-        header_idx = 0
-        for i, line in enumerate(lines):
-            if line.startswith("#gene1") or line.startswith("gene1"):
-                header_idx = i
-                break
-
-        if header_idx >= len(lines) - 1:
+        header_line, lines = self.split_header(content, "#gene1", "gene1")
+        if not header_line:
             return fusions
 
-        header = lines[header_idx].lstrip("#").split("\t")
+        header = header_line.lstrip("#").split("\t")
         col_map = {col: i for i, col in enumerate(header)}
 
-        for line in lines[header_idx + 1:]:
+        # Resolve column positions once; each row is then one split and one
+        # itemgetter call rather than a dict lookup per field
+        get_fields = itemgetter(
+            col_map.get("gene1", 0),
+            col_map.get("gene2", 1),
+            col_map.get("strand1(gene/fusion)", 2),
+            col_map.get("strand2(gene/fusion)", 3),
+            col_map.get("breakpoint1", 4),
+            col_map.get("breakpoint2", 5),
+            col_map.get("split_reads1", 10),
+            col_map.get("split_reads2", 11),
+            col_map.get("discordant_mates", 12),
+        )
+        parse_breakpoint = self._parse_arriba_breakpoint
+
+        for line in lines:
             if not line.strip() or line.startswith("#"):
                 continue
 
@@ -39,33 +47,20 @@ class ArribaParser(BaseFusionParser):
                 continue
 
             try:
-                gene_a_symbol = cols[col_map.get("gene1", 0)]
-                gene_b_symbol = cols[col_map.get("gene2", 1)]
-
-                # Parse strands (Arriba format: strand1(gene/fusion))
-                strand1_col = cols[col_map.get("strand1(gene/fusion)", 2)]
-                strand2_col = cols[col_map.get("strand2(gene/fusion)", 3)]
+                (gene_a_symbol, gene_b_symbol, strand1_col, strand2_col,
+                 breakpoint1, breakpoint2, split_reads1, split_reads2,
+                 discordant_mates) = get_fields(cols)
 
-                # Extract fusion strand (second value after /)
+                # Extract fusion strand (Arriba format: strand1(gene/fusion))
                 strand_a = strand1_col.split("/")[1] if "/" in strand1_col else strand1_col
                 strand_b = strand2_col.split("/")[1] if "/" in strand2_col else strand2_col
 
                 # Parse breakpoints (format: chr:position)
-                breakpoint1 = cols[col_map.get("breakpoint1", 4)]
-                breakpoint2 = cols[col_map.get("breakpoint2", 5)]
-
-                chr_a, pos_a = self._parse_arriba_breakpoint(breakpoint1)
-                chr_b, pos_b = self._parse_arriba_breakpoint(breakpoint2)
-
-                # Parse read counts
-                split_reads1 = int(cols[col_map.get("split_reads1", 10)])
-                split_reads2 = int(cols[col_map.get("split_reads2", 11)])
-                discordant_mates = int(cols[col_map.get("discordant_mates", 12)])
-
-                junction_reads = split_reads1 + split_reads2
-                spanning_reads = discordant_mates
+                chr_a, pos_a = parse_breakpoint(breakpoint1)
+                chr_b, pos_b = parse_breakpoint(breakpoint2)
 
-                fusion = FusionCreate(
+                # Fields are already converted above, so skip re-validation
+                fusion = FusionCreate.model_construct(
                     gene_a_symbol=gene_a_symbol,
                     gene_a_chromosome=chr_a,
                     gene_a_breakpoint=pos_a,
@@ -74,15 +69,15 @@ class ArribaParser(BaseFusionParser):
                     gene_b_chromosome=chr_b,
                     gene_b_breakpoint=pos_b,
                     gene_b_strand=strand_b,
-                    junction_reads=junction_reads,
-                    spanning_reads=spanning_reads
+                    junction_reads=int(split_reads1) + int(split_reads2),
+                    spanning_reads=int(discordant_mates)
                 )
                 fusions.append(fusion)
 
             except (ValueError, IndexError, KeyError) as e:
                 continue
 
-        return fusions
+        return self._dedupe(fusions)
 
     @staticmethod
     def _parse_arriba_breakpoint(breakpoint_str: str) -> tuple[str, int]:
@@ -90,6 +85,6 @@ class ArribaParser(BaseFusionParser):
         parts = breakpoint_str.split(":")
         if len(parts) != 2:
             raise ValueError(f"Invalid Arriba breakpoint format: {breakpoint_str}")
-        chromosome = parts[0].replace("chr", "")
+        chromosome = parts[0].removeprefix("chr")
         position = int(parts[1])
         return chromosome, position
@@ -1,7 +1,19 @@
+import re
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, Iterator, List, Optional, Tuple
 from app.schemas.fusion import FusionCreate
 
+_NON_SPACE_RE = re.compile(r"\S")
+
+
+def _add_reads(a: Optional[int], b: Optional[int]) -> Optional[int]:
+    """Sum two optional read counts; unknown only if both are."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return a + b
+
 
 class BaseFusionParser(ABC):
     """Base class for fusion file parsers."""
@@ -11,13 +23,82 @@ class BaseFusionParser(ABC):
         """Parse file content and return list of fusion objects."""
         pass
 
+    @staticmethod
+    def iter_lines(content: str, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        """Yield the lines of content[start:stop], without building a list of them."""
+        if stop is None:
+            stop = len(content)
+        find = content.find
+        while True:
+            end = find("\n", start, stop)
+            if end == -1:
+                yield content[start:stop]
+                return
+            yield content[start:end]
+            start = end + 1
+
+    @classmethod
+    def split_header(cls, content: str, *prefixes: str) -> Tuple[str, Iterator[str]]:
+        """Find a TSV's header line and iterate the lines after it.
+
+        Lines are those of the content with surrounding whitespace removed,
+        as stripping and splitting it would give, but without copying it. The
+        header is the first line starting with one of prefixes, or the first
+        line if none does.
+        """
+        match = _NON_SPACE_RE.search(content)
+        if match is None:
+            return "", iter(())
+        first = match.start()
+        stop = len(content)
+        while content[stop - 1].isspace():
+            stop -= 1
+
+        header_start = first
+        if not content.startswith(prefixes, first, stop):
+            found = [i for i in (content.find("\n" + p, first, stop) for p in prefixes) if i != -1]
+            if found:
+                header_start = min(found) + 1
+
+        header_end = content.find("\n", header_start, stop)
+        if header_end == -1:
+            return content[header_start:stop], iter(())
+        return content[header_start:header_end], cls.iter_lines(content, header_end + 1, stop)
+
+    @staticmethod
+    def _dedupe(fusions: List[FusionCreate]) -> List[FusionCreate]:
+        """Merge rows for the same fusion junction, summing their read counts.
+
+        Rows match on both genes' symbol, chromosome, breakpoint and strand,
+        and genome build. The first row's position in the list is kept.
+        """
+        merged: Dict[tuple, FusionCreate] = {}
+        for fusion in fusions:
+            key = (
+                fusion.gene_a_symbol, fusion.gene_a_chromosome,
+                fusion.gene_a_breakpoint, fusion.gene_a_strand,
+                fusion.gene_b_symbol, fusion.gene_b_chromosome,
+                fusion.gene_b_breakpoint, fusion.gene_b_strand,
+                fusion.genome_build,
+            )
+            first = merged.get(key)
+            if first is None:
+                merged[key] = fusion
+            else:
+                merged[key] = first.model_copy(update={
+                    "junction_reads": _add_reads(first.junction_reads, fusion.junction_reads),
+                    "spanning_reads": _add_reads(first.spanning_reads, fusion.spanning_reads),
+                })
+        if len(merged) == len(fusions):
+            return fusions
+        return list(merged.values())
+
     @staticmethod
     def parse_breakpoint(breakpoint_str: str) -> tuple[str, int, str]:
         """Parse breakpoint string in format chr:pos:strand."""
-        parts = breakpoint_str.split(":")
-        if len(parts) != 3:
+        # Two partitions rather than split(): no list per breakpoint
+        chromosome, _, rest = breakpoint_str.partition(":")
+        position, sep, strand = rest.partition(":")
+        if not sep or ":" in strand:
             raise ValueError(f"Invalid breakpoint format: {breakpoint_str}")
-        chromosome = parts[0].replace("chr", "")
-        position = int(parts[1])
-        strand = parts[2]
-        return chromosome, position, strand
+        return chromosome.removeprefix("chr"), int(position), strand
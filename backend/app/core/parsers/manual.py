@@ -25,9 +25,7 @@ class ManualInputParser(BaseFusionParser):
         BCR::ABL1\tchr22:23524427:+\tchr9:133729449:+\thg38
         """
         fusions = []
-        lines = content.strip().split("\n")
-
-        for line in lines:
+        for line in self.iter_lines(content):
             line = line.strip()
             if not line or line.startswith("#"):
                 continue
@@ -39,7 +37,7 @@ class ManualInputParser(BaseFusionParser):
             except (ValueError, IndexError) as e:
                 continue
 
-        return fusions
+        return self._dedupe(fusions)
 
     def _parse_line(self, line: str) -> FusionCreate:
         """Parse a single line of manual input."""
@@ -63,7 +61,8 @@ class ManualInputParser(BaseFusionParser):
         junction_reads = int(parts[4]) if len(parts) > 4 else None
         spanning_reads = int(parts[5]) if len(parts) > 5 else None
 
-        return FusionCreate(
+        # Fields are already typed, so skip re-validation
+        return FusionCreate.model_construct(
             gene_a_symbol=gene_a_symbol,
             gene_a_chromosome=chr_a,
             gene_a_breakpoint=pos_a,
@@ -84,12 +83,11 @@ class ManualInputParser(BaseFusionParser):
 
         # Parse gene names from GENE_A::GENE_B format
         gene_part = parts[0]
-        if "::" in gene_part:
-            gene_names = gene_part.split("::")
-            gene_a_symbol = gene_names[0].strip()
-            gene_b_symbol = gene_names[1].strip()
-        else:
+        gene_a_symbol, sep, rest = gene_part.partition("::")
+        if not sep:
             raise ValueError(f"Invalid gene format: {gene_part}")
+        gene_a_symbol = gene_a_symbol.strip()
+        gene_b_symbol = rest.partition("::")[0].strip()
 
         breakpoint_a = parts[1]
         breakpoint_b = parts[2]
@@ -100,7 +98,7 @@ class ManualInputParser(BaseFusionParser):
         # Optional genome build (parts[3])
         genome_build = parts[3].strip() if len(parts) > 3 else "hg38"
 
-        return FusionCreate(
+        return FusionCreate.model_construct(
             gene_a_symbol=gene_a_symbol,
             gene_a_chromosome=chr_a,
             gene_a_breakpoint=pos_a,
@@ -114,24 +112,11 @@ class ManualInputParser(BaseFusionParser):
             genome_build=genome_build
         )
 
-    @staticmethod
-    def parse_manual_input(input_data: FusionManualInput) -> FusionCreate:
+    @classmethod
+    def parse_manual_input(cls, input_data: FusionManualInput) -> FusionCreate:
         """Parse a single manual fusion input from the form."""
-        # Parse breakpoint A
-        parts_a = input_data.gene_a_breakpoint.split(":")
-        if len(parts_a) != 3:
-            raise ValueError(f"Invalid breakpoint A format: {input_data.gene_a_breakpoint}")
-        chr_a = parts_a[0].replace("chr", "")
-        pos_a = int(parts_a[1])
-        strand_a = parts_a[2]
-
-        # Parse breakpoint B
-        parts_b = input_data.gene_b_breakpoint.split(":")
-        if len(parts_b) != 3:
-            raise ValueError(f"Invalid breakpoint B format: {input_data.gene_b_breakpoint}")
-        chr_b = parts_b[0].replace("chr", "")
-        pos_b = int(parts_b[1])
-        strand_b = parts_b[2]
+        chr_a, pos_a, strand_a = cls.parse_breakpoint(input_data.gene_a_breakpoint)
+        chr_b, pos_b, strand_b = cls.parse_breakpoint(input_data.gene_b_breakpoint)
 
         return FusionCreate(
             gene_a_symbol=input_data.gene_a_symbol,
@@ -1,8 +1,12 @@
 import re
+from operator import itemgetter
 from typing import List
 from app.core.parsers.base import BaseFusionParser
 from app.schemas.fusion import FusionCreate
 
+# GENE1--GENE2 fusion names
+FUSION_NAME_RE = re.compile(r"(\w+)--(\w+)")
+
 
 class StarFusionParser(BaseFusionParser):
     """Parser for STAR-Fusion output files."""
@@ -16,51 +20,55 @@ class StarFusionParser(BaseFusionParser):
         RightGene RightBreakpoint ...
         """
         fusions = []
-        lines = content.strip().split("\n")
-
-        # Find header line
-        header_idx = 0
-        for i, line in enumerate(lines):
-            if line.startswith("#FusionName") or line.startswith("FusionName"):
-                header_idx = i
-                break
-
-        if header_idx >= len(lines) - 1:
+        header_line, lines = self.split_header(content, "#FusionName", "FusionName")
+        if not header_line:
             return fusions
 
-        header = lines[header_idx].lstrip("#").split("\t")
+        header = header_line.lstrip("#").split("\t")
         col_map = {col: i for i, col in enumerate(header)}
 
-        for line in lines[header_idx + 1:]:
+        # Resolve column positions once, as in ArribaParser
+        indices = (
+            col_map.get("FusionName", 0),
+            col_map.get("JunctionReadCount", 1),
+            col_map.get("SpanningFragCount", 2),
+            col_map.get("LeftBreakpoint", 4),
+            col_map.get("RightBreakpoint", 6),
+        )
+        get_fields = itemgetter(*indices)
+        # Only split as far as the last column we read; the trailing
+        # annotation columns stay in one unsplit remainder.
+        max_split = max(max(indices), 6) + 1
+        parse_breakpoint = self.parse_breakpoint
+
+        for line in lines:
             if not line.strip() or line.startswith("#"):
                 continue
 
-            cols = line.split("\t")
+            cols = line.split("\t", max_split)
             if len(cols) < 7:
                 continue
 
             try:
-                # Parse fusion name (GENE1--GENE2)
-                fusion_name = cols[col_map.get("FusionName", 0)]
-                gene_match = re.match(r"(\w+)--(\w+)", fusion_name)
-                if not gene_match:
-                    continue
-
-                gene_a_symbol = gene_match.group(1)
-                gene_b_symbol = gene_match.group(2)
-
-                # Parse junction and spanning reads
-                junction_reads = int(cols[col_map.get("JunctionReadCount", 1)])
-                spanning_reads = int(cols[col_map.get("SpanningFragCount", 2)])
+                (fusion_name, junction_reads, spanning_reads,
+                 left_breakpoint, right_breakpoint) = get_fields(cols)
+
+                # Parse fusion name (GENE1--GENE2). Plain alphanumeric
+                # symbols split on the separator; anything else (underscores,
+                # trailing annotations) goes through the regex.
+                gene_a_symbol, sep, gene_b_symbol = fusion_name.partition("--")
+                if not (sep and gene_a_symbol.isalnum() and gene_b_symbol.isalnum()):
+                    gene_match = FUSION_NAME_RE.match(fusion_name)
+                    if not gene_match:
+                        continue
+                    gene_a_symbol, gene_b_symbol = gene_match.groups()
 
                 # Parse breakpoints
-                left_breakpoint = cols[col_map.get("LeftBreakpoint", 4)]
-                right_breakpoint = cols[col_map.get("RightBreakpoint", 6)]
-
-                chr_a, pos_a, strand_a = self.parse_breakpoint(left_breakpoint)
-                chr_b, pos_b, strand_b = self.parse_breakpoint(right_breakpoint)
+                chr_a, pos_a, strand_a = parse_breakpoint(left_breakpoint)
+                chr_b, pos_b, strand_b = parse_breakpoint(right_breakpoint)
 
-                fusion = FusionCreate(
+                # Fields are already converted above, so skip re-validation
+                fusion = FusionCreate.model_construct(
                     gene_a_symbol=gene_a_symbol,
                     gene_a_chromosome=chr_a,
                     gene_a_breakpoint=pos_a,
@@ -69,8 +77,8 @@ class StarFusionParser(BaseFusionParser):
                     gene_b_chromosome=chr_b,
                     gene_b_breakpoint=pos_b,
                     gene_b_strand=strand_b,
-                    junction_reads=junction_reads,
-                    spanning_reads=spanning_reads
+                    junction_reads=int(junction_reads),
+                    spanning_reads=int(spanning_reads)
                 )
                 fusions.append(fusion)
 
@@ -78,4 +86,4 @@ class StarFusionParser(BaseFusionParser):
                 # Skip malformed lines
                 continue
 
-        return fusions
+        return self._dedupe(fusions)
@@ -1,4 +1,6 @@
+from sqlalchemy import inspect, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.orm import DeclarativeBase
 from app.config import get_settings
 
@@ -31,7 +33,33 @@ async def get_db():
 
 async def init_db():
     # Import models to register them with Base.metadata
-    from app.models import Gene, Transcript, Exon, Protein, Domain, Session, Fusion  # noqa: F401
+    from app.models import Gene, Transcript, Exon, Protein, Domain, Session, Fusion, StudyProfile, GnomadGeneVariants  # noqa: F401
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_add_missing_columns)
+        await conn.run_sync(_create_missing_indexes)
+
+
+def _add_missing_columns(sync_conn):
+    # create_all doesn't alter existing tables either; columns added to a
+    # model later (all nullable) are appended with ALTER TABLE
+    inspector = inspect(sync_conn)
+    for table in Base.metadata.sorted_tables:
+        existing = {c["name"] for c in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing:
+                column_type = column.type.compile(dialect=sync_conn.dialect)
+                sync_conn.execute(text(
+                    f'ALTER TABLE {table.name} ADD COLUMN "{column.name}" {column_type}'
+                ))
+
+
+def _create_missing_indexes(sync_conn):
+    # create_all skips tables that already exist, so indexes added to a model
+    # later would never reach an existing database file
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            # IF NOT EXISTS rather than checkfirst: SQLite reflection skips
+            # expression indexes such as lower(symbol)
+            sync_conn.execute(CreateIndex(index, if_not_exists=True))
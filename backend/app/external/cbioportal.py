@@ -9,15 +9,24 @@ cBioPortal aggregates mutation data from multiple sources including:
 
 import httpx
 import asyncio
-from typing import Optional, List, Dict, Any
-from tenacity import retry, stop_after_attempt, wait_exponential
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any, Tuple
 import logging
 
+from sqlalchemy import select
+
+from app.database import async_session_maker
+from app.models import StudyProfile
 from app.external.protein_utils import (
+    THREE_TO_ONE_MAP,
     extract_protein_position,
     three_to_one_aa,
     normalize_mutation_type,
 )
+from app.external.rate_limit import CONNECT_RETRIES, ConcurrencyLimit, with_retries
 
 logger = logging.getLogger(__name__)
 
@@ -40,13 +49,62 @@ DEFAULT_STUDY_IDS = [
     "pediatric_dkfz_2017",
 ]
 
+# Amino acid before and after the position in a protein change (e.g. V600E)
+REF_AA_RE = re.compile(r'^([A-Z][a-z]{0,2})')
+ALT_AA_RE = re.compile(r'\d+([A-Z][a-z]{0,2}|\*|fs|del|ins|dup)$')
+ALT_AA_MAX_MATCH = 5
+# The common simple form, reference, position and alternate in one match
+PROTEIN_CHANGE_RE = re.compile(r'(?:p\.)?([A-Z][a-z]{0,2})(\d+)([A-Z][a-z]{0,2}|\*|fs|del|ins|dup)')
+
+# Aggregated counts only change with cBioPortal data releases
+MUTATION_COUNTS_TTL_SECONDS = 24 * 60 * 60
+# Genes kept, least recently used evicted first
+MUTATION_COUNTS_CACHE_SIZE = 1024
+# Study -> mutation profile mappings kept in the database
+STUDY_PROFILES_TTL = timedelta(days=7)
+
 
 class CBioPortalClient:
-    """Async client for cBioPortal REST API."""
+    """Async client for cBioPortal REST API.
+
+    Requests share one pooled httpx client, so the per-study fan-out reuses
+    keep-alive connections instead of a new TLS handshake per request.
+    """
 
     def __init__(self):
-        self._semaphore = asyncio.Semaphore(5)  # Rate limit
+        self._concurrency = ConcurrencyLimit(5)  # Rate limit
         self._study_profiles_cache: Dict[str, Optional[str]] = {}
+        # Profiles fetched from cBioPortal but not yet written to the database
+        self._study_profiles_unsaved: Dict[str, Optional[str]] = {}
+        # Profile lookups in flight, shared by concurrent callers for the same study
+        self._study_profiles_pending: Dict[str, "asyncio.Task[Optional[str]]"] = {}
+        # gene symbol -> (fetched_at, aggregated counts), least recently used first
+        self._mutation_counts_cache: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        # Lookups in flight, shared by concurrent callers for the same gene
+        self._mutation_counts_pending: Dict[str, "asyncio.Task[List[Dict[str, Any]]]"] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            # Failed connects are retried by the transport on the same
+            # pool; with_retries handles 429/5xx and mid-request failures
+            transport = httpx.AsyncHTTPTransport(
+                retries=CONNECT_RETRIES,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+            )
+            self._client = httpx.AsyncClient(
+                transport=transport,
+                timeout=60.0,
+                headers={"Accept": "application/json"}
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def _request(
         self,
@@ -55,53 +113,106 @@ class CBioPortalClient:
         params: Optional[Dict] = None,
         json_data: Optional[Any] = None
     ) -> Any:
-        """Make a rate-limited request to cBioPortal API."""
-        async with self._semaphore:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                url = f"{CBIOPORTAL_API_BASE}{endpoint}"
-                headers = {"Accept": "application/json"}
-
-                try:
-                    if method == "GET":
-                        response = await client.get(url, params=params, headers=headers)
-                    else:
-                        headers["Content-Type"] = "application/json"
-                        response = await client.post(url, params=params, json=json_data, headers=headers)
-
-                    response.raise_for_status()
-                    return response.json()
-                except httpx.HTTPStatusError as e:
-                    logger.warning(f"cBioPortal API error {e.response.status_code} for {endpoint}")
-                    raise
-                except Exception as e:
-                    logger.warning(f"cBioPortal request failed for {endpoint}: {e}")
-                    raise
+        """Make a rate-limited request to cBioPortal API, retrying transient errors."""
+        url = f"{CBIOPORTAL_API_BASE}{endpoint}"
+        try:
+            return await with_retries(
+                lambda: self._send(method, url, params, json_data), min_wait=2.0
+            )
+        except httpx.HTTPStatusError as e:
+            logger.warning(f"cBioPortal API error {e.response.status_code} for {endpoint}")
+            raise
+        except Exception as e:
+            logger.warning(f"cBioPortal request failed for {endpoint}: {e}")
+            raise
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        json_data: Optional[Any]
+    ) -> Any:
+        """Make one rate-limited request."""
+        async with self._concurrency:
+            client = self._get_client()
+            if method == "GET":
+                response = await client.get(url, params=params)
+            else:
+                response = await client.post(url, params=params, json=json_data)
+
+            response.raise_for_status()
+            return response.json()
 
     async def _get_mutation_profile_id(self, study_id: str) -> Optional[str]:
-        """Get the mutation molecular profile ID for a study."""
+        """Get the mutation molecular profile ID for a study.
+
+        Concurrent misses for the same study share one lookup.
+        """
         if study_id in self._study_profiles_cache:
             return self._study_profiles_cache[study_id]
 
+        task = self._study_profiles_pending.get(study_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_mutation_profile_id(study_id))
+            self._study_profiles_pending[study_id] = task
+            task.add_done_callback(lambda _: self._study_profiles_pending.pop(study_id, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_mutation_profile_id(self, study_id: str) -> Optional[str]:
+        """Look up a study's mutation molecular profile ID (uncached)."""
         try:
             profiles = await self._request(
                 "GET",
                 f"/studies/{study_id}/molecular-profiles"
             )
 
+            profile_id = None
             for profile in profiles:
                 if profile.get("molecularAlterationType") == "MUTATION_EXTENDED":
                     profile_id = profile.get("molecularProfileId")
-                    self._study_profiles_cache[study_id] = profile_id
-                    return profile_id
+                    break
 
-            self._study_profiles_cache[study_id] = None
-            return None
+            self._study_profiles_cache[study_id] = profile_id
+            self._study_profiles_unsaved[study_id] = profile_id
+            return profile_id
 
         except Exception:
             self._study_profiles_cache[study_id] = None
             return None
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+    async def _load_study_profiles(self, study_ids: List[str]) -> None:
+        """Fill the in-memory profile cache from the database."""
+        missing = [study_id for study_id in study_ids if study_id not in self._study_profiles_cache]
+        if not missing:
+            return
+        try:
+            async with async_session_maker() as db:
+                result = await db.execute(
+                    select(StudyProfile.study_id, StudyProfile.profile_id)
+                    .where(StudyProfile.study_id.in_(missing))
+                    .where(StudyProfile.cached_at > datetime.utcnow() - STUDY_PROFILES_TTL)
+                )
+                for study_id, profile_id in result:
+                    self._study_profiles_cache[study_id] = profile_id
+        except Exception as e:
+            logger.debug(f"Could not load cached study profiles: {e}")
+
+    async def _save_study_profiles(self) -> None:
+        """Write newly fetched study profiles to the database."""
+        if not self._study_profiles_unsaved:
+            return
+        unsaved, self._study_profiles_unsaved = self._study_profiles_unsaved, {}
+        try:
+            async with async_session_maker() as db:
+                for study_id, profile_id in unsaved.items():
+                    await db.merge(StudyProfile(
+                        study_id=study_id, profile_id=profile_id, cached_at=datetime.utcnow()
+                    ))
+                await db.commit()
+        except Exception as e:
+            logger.debug(f"Could not save study profiles: {e}")
+
     async def get_gene_mutations(
         self,
         gene_symbol: str,
@@ -132,9 +243,12 @@ class CBioPortalClient:
             if not study_ids:
                 study_ids = DEFAULT_STUDY_IDS
 
-            # Get mutation profiles for all studies in parallel
+            # Get mutation profiles for all studies in parallel, starting
+            # from those saved by earlier runs
+            await self._load_study_profiles(study_ids)
             profile_tasks = [self._get_mutation_profile_id(study_id) for study_id in study_ids]
             profile_results = await asyncio.gather(*profile_tasks, return_exceptions=True)
+            await self._save_study_profiles()
 
             # Collect valid profile IDs
             valid_profiles = []
@@ -148,21 +262,27 @@ class CBioPortalClient:
 
             logger.info(f"Querying {len(valid_profiles)} mutation profiles for {gene_symbol}")
 
-            # Query mutations using the bulk endpoint
-            all_mutations = []
-
-            # Query each profile (cBioPortal doesn't support bulk gene queries well)
-            mutation_tasks = []
-            for profile_id in valid_profiles:
-                mutation_tasks.append(
-                    self._fetch_mutations_for_profile(profile_id, entrez_id)
+            # Query all profiles in one request to the bulk endpoint
+            try:
+                mutations = await self._request(
+                    "POST",
+                    "/mutations/fetch",
+                    params={"projection": "SUMMARY"},
+                    json_data={"molecularProfileIds": valid_profiles, "entrezGeneIds": [entrez_id]}
                 )
+                all_mutations = self._mutation_records(mutations)
+            except Exception as e:
+                # Fall back to one request per profile
+                logger.warning(f"Bulk mutation fetch failed for {gene_symbol}, querying profiles separately: {e}")
+                mutation_results = await asyncio.gather(*(
+                    self._fetch_mutations_for_profile(profile_id, entrez_id)
+                    for profile_id in valid_profiles
+                ), return_exceptions=True)
 
-            mutation_results = await asyncio.gather(*mutation_tasks, return_exceptions=True)
-
-            for result in mutation_results:
-                if isinstance(result, list):
-                    all_mutations.extend(result)
+                all_mutations = []
+                for result in mutation_results:
+                    if isinstance(result, list):
+                        all_mutations.extend(result)
 
             logger.info(f"Found {len(all_mutations)} total mutations for {gene_symbol}")
             return all_mutations
@@ -183,31 +303,63 @@ class CBioPortalClient:
                 f"/molecular-profiles/{profile_id}/mutations",
                 params={"entrezGeneId": entrez_id}
             )
-
-            result = []
-            for mut in mutations:
-                protein_change = mut.get("proteinChange", "")
-                aa_position = self._parse_protein_position(protein_change)
-
-                if aa_position:
-                    result.append({
-                        "position": aa_position,
-                        "protein_change": protein_change,
-                        "mutation_type": mut.get("mutationType", "unknown"),
-                        "variant_type": mut.get("variantType", ""),
-                        "study_id": profile_id,
-                        "sample_id": mut.get("sampleId"),
-                        "ref_aa": self._extract_ref_aa(protein_change),
-                        "alt_aa": self._extract_alt_aa(protein_change),
-                    })
-
-            return result
+            return self._mutation_records(mutations, profile_id)
 
         except Exception as e:
             logger.debug(f"Error fetching from {profile_id}: {e}")
             return []
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+    def _mutation_records(
+        self,
+        mutations: List[Dict[str, Any]],
+        profile_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Convert cBioPortal mutations to records, skipping those without a protein position.
+
+        Without profile_id, each record is tagged with its own molecularProfileId.
+        """
+        result = []
+        # Hotspot changes (e.g. V600E) recur across samples; parse each once
+        parsed: Dict[str, Tuple[Optional[int], str, str]] = {}
+        for mut in mutations:
+            protein_change = mut.get("proteinChange", "")
+            parsed_change = parsed.get(protein_change)
+            if parsed_change is None:
+                parsed_change = parsed[protein_change] = self._parse_protein_change(protein_change)
+            aa_position, ref_aa, alt_aa = parsed_change
+
+            if aa_position:
+                result.append({
+                    "position": aa_position,
+                    "protein_change": protein_change,
+                    "mutation_type": mut.get("mutationType", "unknown"),
+                    "variant_type": mut.get("variantType", ""),
+                    "study_id": profile_id or mut.get("molecularProfileId"),
+                    "sample_id": mut.get("sampleId"),
+                    "ref_aa": ref_aa,
+                    "alt_aa": alt_aa,
+                })
+        return result
+
+    def _parse_protein_change(self, protein_change: str) -> Tuple[Optional[int], str, str]:
+        """Extract (position, ref_aa, alt_aa) from a protein change string.
+
+        Simple changes like 'V600E' or 'p.Arg123Cys' are parsed in one regex
+        match; anything else goes through the separate extractors.
+        """
+        match = PROTEIN_CHANGE_RE.fullmatch(protein_change) if protein_change else None
+        if match is None:
+            return (
+                self._parse_protein_position(protein_change),
+                self._extract_ref_aa(protein_change),
+                self._extract_alt_aa(protein_change),
+            )
+
+        # 1-letter codes and the *, fs, del, ins, dup tokens are not keys of
+        # the 3-letter table, so one dict probe converts or keeps each code
+        ref_aa, position, alt_aa = match.groups()
+        return int(position), THREE_TO_ONE_MAP.get(ref_aa, ref_aa), THREE_TO_ONE_MAP.get(alt_aa, alt_aa)
+
     async def get_mutation_counts(
         self,
         gene_symbol: str,
@@ -217,7 +369,34 @@ class CBioPortalClient:
         Get aggregated mutation counts by position for a gene.
 
         Returns mutations with count/frequency data suitable for lollipop plot.
+        Results are cached per gene for MUTATION_COUNTS_TTL_SECONDS (at most
+        MUTATION_COUNTS_CACHE_SIZE genes, least recently used evicted), and
+        concurrent calls for the same gene share one lookup.
         """
+        cached = self._mutation_counts_cache.get(gene_symbol)
+        if cached:
+            if time.monotonic() - cached[0] < MUTATION_COUNTS_TTL_SECONDS:
+                self._mutation_counts_cache.move_to_end(gene_symbol)
+                return cached[1]
+            del self._mutation_counts_cache[gene_symbol]
+
+        task = self._mutation_counts_pending.get(gene_symbol)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_mutation_counts(gene_symbol))
+            self._mutation_counts_pending[gene_symbol] = task
+            task.add_done_callback(lambda _: self._mutation_counts_pending.pop(gene_symbol, None))
+
+        result = await asyncio.shield(task)
+        # Empty results are not cached: get_gene_mutations returns [] on errors too
+        if result:
+            self._mutation_counts_cache[gene_symbol] = (time.monotonic(), result)
+            self._mutation_counts_cache.move_to_end(gene_symbol)
+            while len(self._mutation_counts_cache) > MUTATION_COUNTS_CACHE_SIZE:
+                self._mutation_counts_cache.popitem(last=False)
+        return result
+
+    async def _fetch_mutation_counts(self, gene_symbol: str) -> List[Dict[str, Any]]:
+        """Fetch and aggregate a gene's mutations by position and change (uncached)."""
         mutations = await self.get_gene_mutations(gene_symbol)
 
         if not mutations:
@@ -225,13 +404,14 @@ class CBioPortalClient:
             return []
 
         # Aggregate by position and amino acid change
-        position_counts: Dict[str, Dict] = {}
+        position_counts: Dict[Tuple[int, str], Dict] = {}
 
         for mut in mutations:
-            key = f"{mut['position']}_{mut['protein_change']}"
+            key = (mut["position"], mut["protein_change"])
+            entry = position_counts.get(key)
 
-            if key not in position_counts:
-                position_counts[key] = {
+            if entry is None:
+                entry = position_counts[key] = {
                     "position": mut["position"],
                     "ref_aa": mut["ref_aa"],
                     "alt_aa": mut["alt_aa"],
@@ -241,7 +421,7 @@ class CBioPortalClient:
                     "source": "cBioPortal",
                 }
 
-            position_counts[key]["count"] += 1
+            entry["count"] += 1
 
         # Convert to list and sort by count (most frequent first), then position
         result = list(position_counts.values())
@@ -263,8 +443,7 @@ class CBioPortalClient:
             protein_change = protein_change[2:]
 
         # First character(s) before the number
-        import re
-        match = re.match(r'^([A-Z][a-z]{0,2})', protein_change)
+        match = REF_AA_RE.match(protein_change)
         if match:
             aa = match.group(1)
             # Convert 3-letter to 1-letter if needed
@@ -277,12 +456,9 @@ class CBioPortalClient:
         if not protein_change:
             return ""
 
-        if protein_change.startswith("p."):
-            protein_change = protein_change[2:]
-
-        # Last character(s) after the number
-        import re
-        match = re.search(r'\d+([A-Z][a-z]{0,2}|\*|fs|del|ins|dup)$', protein_change)
+        # Last character(s) after the number. A match spans at most a digit,
+        # a 3-letter code and the newline $ allows, so only the tail is searched.
+        match = ALT_AA_RE.search(protein_change[-ALT_AA_MAX_MATCH:])
         if match:
             aa = match.group(1)
             if aa == "*":
@@ -312,3 +488,9 @@ def get_cbioportal_client() -> CBioPortalClient:
     if _cbioportal_client is None:
         _cbioportal_client = CBioPortalClient()
     return _cbioportal_client
+
+
+async def close_cbioportal_client() -> None:
+    """Close the HTTP connections of the cBioPortal client, if created."""
+    if _cbioportal_client is not None:
+        await _cbioportal_client.aclose()
@@ -1,8 +1,13 @@
 import httpx
-import asyncio
-from typing import Optional, List, Dict, Any
-from tenacity import retry, stop_after_attempt, wait_exponential
+from typing import Optional, List, Dict, Any, AsyncIterator
 from app.config import get_settings
+from app.external.rate_limit import (
+    CONNECT_RETRIES,
+    ConcurrencyLimit,
+    TokenBucket,
+    retry_after_seconds,
+    with_retries,
+)
 
 
 ENSEMBL_URLS = {
@@ -10,15 +15,48 @@ ENSEMBL_URLS = {
     "hg19": "https://grch37.rest.ensembl.org",
 }
 
+# Ensembl's limit on IDs per POST /lookup/id request
+BULK_LOOKUP_MAX_IDS = 1000
+
 
 class EnsemblClient:
-    """Async client for Ensembl REST API."""
+    """Async client for Ensembl REST API.
+
+    Requests share one pooled httpx client, so concurrent and back-to-back
+    lookups reuse keep-alive connections instead of a new TLS handshake each.
+    """
 
     def __init__(self, genome_build: str = "hg38"):
         self.settings = get_settings()
         self.genome_build = genome_build
         self.base_url = ENSEMBL_URLS.get(genome_build, ENSEMBL_URLS["hg38"])
-        self._semaphore = asyncio.Semaphore(self.settings.ensembl_rate_limit)
+        self._concurrency = ConcurrencyLimit(self.settings.ensembl_rate_limit)
+        self._bucket = TokenBucket(
+            rate=self.settings.ensembl_rate_limit,
+            capacity=self.settings.ensembl_burst
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            # Failed connects are retried by the transport on the same
+            # pool; with_retries handles 429/5xx and mid-request failures
+            transport = httpx.AsyncHTTPTransport(
+                retries=CONNECT_RETRIES,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+            )
+            self._client = httpx.AsyncClient(
+                transport=transport,
+                timeout=30.0
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def _strip_genome_suffix(self, ensembl_id: str) -> str:
         """Strip genome build suffix from composite ID (e.g., 'ENST00000305877_hg38' -> 'ENST00000305877')."""
@@ -26,17 +64,46 @@ class EnsemblClient:
             return ensembl_id.rsplit("_", 1)[0]
         return ensembl_id
 
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        headers: Dict[str, str],
+        params: Optional[Dict] = None,
+        json_data: Optional[Any] = None
+    ) -> httpx.Response:
+        """Make one rate-limited request to Ensembl API."""
+        await self._bucket.acquire()
+        async with self._concurrency:
+            url = f"{self.base_url}{endpoint}"
+            response = await self._get_client().request(
+                method, url, params=params, json=json_data, headers=headers
+            )
+            if response.status_code == 429:
+                # Hold all requests for as long as Ensembl asks; the
+                # raised error is then retried by with_retries
+                self._bucket.pause(retry_after_seconds(response))
+            response.raise_for_status()
+            return response
+
+    async def _get(self, endpoint: str, params: Optional[Dict], content_type: str) -> httpx.Response:
+        """Make a rate-limited GET request to Ensembl API, retrying transient errors."""
+        headers = {"Content-Type": content_type}
+        return await with_retries(lambda: self._send("GET", endpoint, headers, params))
+
+    async def _post(self, endpoint: str, json_data: Any, params: Optional[Dict] = None) -> Any:
+        """Make a rate-limited POST request to Ensembl API, retrying transient errors."""
+        headers = {"Content-Type": "application/json", "Accept": "application/json"}
+        response = await with_retries(
+            lambda: self._send("POST", endpoint, headers, params, json_data)
+        )
+        return response.json()
+
     async def _request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """Make a rate-limited request to Ensembl API."""
-        async with self._semaphore:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                url = f"{self.base_url}{endpoint}"
-                headers = {"Content-Type": "application/json"}
-                response = await client.get(url, params=params, headers=headers)
-                response.raise_for_status()
-                return response.json()
+        response = await self._get(endpoint, params, "application/json")
+        return response.json()
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
     async def search_gene(self, symbol: str, species: str = "human") -> Optional[Dict[str, Any]]:
         """Search for a gene by symbol."""
         try:
@@ -48,7 +115,6 @@ class EnsemblClient:
                 return None
             raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
     async def get_gene_by_id(self, gene_id: str) -> Optional[Dict[str, Any]]:
         """Get gene information by Ensembl ID."""
         try:
@@ -61,7 +127,6 @@ class EnsemblClient:
                 return None
             raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
     async def get_transcript(self, transcript_id: str) -> Optional[Dict[str, Any]]:
         """Get transcript information with exons."""
         try:
@@ -74,7 +139,20 @@ class EnsemblClient:
                 return None
             raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
+    async def get_transcripts_bulk(self, transcript_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get several transcripts with exons in one request.
+
+        Returns the lookups by Ensembl ID (build suffix stripped); IDs Ensembl
+        does not know map to None. At most BULK_LOOKUP_MAX_IDS IDs per call.
+        """
+        ensembl_ids = [self._strip_genome_suffix(tid) for tid in transcript_ids]
+        if not ensembl_ids:
+            return {}
+        result = await self._post(
+            "/lookup/id", {"ids": ensembl_ids}, params={"expand": 1, "utr": 1}
+        )
+        return {ensembl_id: result.get(ensembl_id) for ensembl_id in ensembl_ids}
+
     async def get_exons(self, transcript_id: str) -> List[Dict[str, Any]]:
         """Get exon information for a transcript."""
         try:
@@ -88,26 +166,38 @@ class EnsemblClient:
                 return []
             raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
+    async def iter_protein_sequence(self, protein_id: str) -> AsyncIterator[str]:
+        """Yield a protein sequence in chunks as Ensembl sends it.
+
+        The request holds its rate-limit slot until the body is consumed.
+        HTTP errors (including 404) are raised before the first chunk.
+        """
+        ensembl_id = self._strip_genome_suffix(protein_id)
+        url = f"{self.base_url}/sequence/id/{ensembl_id}"
+        params = {"type": "protein"}
+        headers = {"Content-Type": "text/plain"}
+
+        await self._bucket.acquire()
+        async with self._concurrency:
+            async with self._get_client().stream("GET", url, params=params, headers=headers) as response:
+                if response.status_code == 429:
+                    self._bucket.pause(retry_after_seconds(response))
+                response.raise_for_status()
+                async for chunk in response.aiter_text():
+                    yield chunk
+
     async def get_protein_sequence(self, protein_id: str) -> Optional[str]:
         """Get protein sequence."""
+        async def read_sequence() -> str:
+            return "".join([chunk async for chunk in self.iter_protein_sequence(protein_id)])
+
         try:
-            ensembl_id = self._strip_genome_suffix(protein_id)
-            endpoint = f"/sequence/id/{ensembl_id}"
-            params = {"type": "protein"}
-            async with self._semaphore:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    url = f"{self.base_url}{endpoint}"
-                    headers = {"Content-Type": "text/plain"}
-                    response = await client.get(url, params=params, headers=headers)
-                    response.raise_for_status()
-                    return response.text
+            return await with_retries(read_sequence)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 return None
             raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
     async def get_protein_features(self, protein_id: str) -> List[Dict[str, Any]]:
         """Get protein features/domains from Ensembl."""
         try:
@@ -120,7 +210,6 @@ class EnsemblClient:
                 return []
             raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
     async def get_cds(self, transcript_id: str) -> Optional[Dict[str, Any]]:
         """Get CDS coordinates for a transcript."""
         try:
@@ -174,3 +263,9 @@ def get_ensembl_client(genome_build: str = "hg38") -> EnsemblClient:
     if genome_build not in _ensembl_clients:
         _ensembl_clients[genome_build] = EnsemblClient(genome_build)
     return _ensembl_clients[genome_build]
+
+
+async def close_ensembl_clients() -> None:
+    """Close the HTTP connections of all EnsemblClient instances."""
+    for client in _ensembl_clients.values():
+        await client.aclose()
@@ -10,10 +10,17 @@ API Documentation: https://gnomad.broadinstitute.org/api
 import httpx
 import asyncio
 import re
-from typing import Optional, List, Dict, Any
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any, Set, Tuple
 from tenacity import retry, stop_after_attempt, wait_exponential
 import logging
 
+from sqlalchemy import select
+
+from app.database import async_session_maker
+from app.models import GnomadGeneVariants
 from app.external.protein_utils import (
     extract_protein_position,
     extract_position_from_hgvsc,
@@ -25,39 +32,164 @@ logger = logging.getLogger(__name__)
 
 GNOMAD_API_URL = "https://gnomad.broadinstitute.org/api"
 
+# Lookups arriving within this window are sent as one aliased GraphQL query
+BATCH_WINDOW_SECONDS = 0.01
+BATCH_MAX_FIELDS = 10
+
+VARIABLE_RE = re.compile(r"\$(\w+)")
+
+# Cached lookups are kept for an hour, least recently used evicted first.
+# Gene variant lists can be MBs each, so far fewer of them are kept.
+CACHE_TTL_SECONDS = 60 * 60
+GENE_VARIANTS_CACHE_SIZE = 100
+VARIANT_CACHE_SIZE = 50000
+
+# Gene variant lists are also kept in the database, shared across restarts
+# and workers. Bump the version when the parsed variant format changes.
+PERSISTED_CACHE_VERSION = "v1"
+PERSISTED_CACHE_TTL = timedelta(days=30)
+
 
 class GnomADClient:
-    """Async client for gnomAD GraphQL API."""
+    """Async client for gnomAD GraphQL API.
+
+    Requests share one pooled httpx client, so repeated queries reuse
+    keep-alive connections instead of a new TLS handshake each.
+    """
 
     def __init__(self):
         """Initialize gnomAD client with rate limiting."""
         self._semaphore = asyncio.Semaphore(5)  # Rate limit
-        self._cache: Dict[str, Any] = {}
+        # cache key -> (fetched_at, result), in least to most recently used order
+        self._gene_variants_cache: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._variant_cache: "OrderedDict[str, Tuple[float, Optional[Dict[str, Any]]]]" = OrderedDict()
+        self._client: Optional[httpx.AsyncClient] = None
+        # Queued (field, variable types, variables, future) lookups for the next batch
+        self._batch: List[Tuple[str, Dict[str, str], Dict[str, Any], "asyncio.Future[Any]"]] = []
+        self._batch_timer: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: Set["asyncio.Task[None]"] = set()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=60.0,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def _graphql_request(self, query: str, variables: Dict = None) -> Dict:
         """Make a rate-limited GraphQL request to gnomAD."""
         async with self._semaphore:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                try:
-                    response = await client.post(
-                        GNOMAD_API_URL,
-                        json={"query": query, "variables": variables or {}},
-                        headers={"Content-Type": "application/json"}
-                    )
-                    response.raise_for_status()
-                    result = response.json()
-
-                    if "errors" in result:
-                        logger.warning(f"gnomAD API errors: {result['errors']}")
-
-                    return result.get("data", {})
-
-                except httpx.HTTPStatusError as e:
-                    logger.warning(f"gnomAD API error {e.response.status_code}")
-                    raise
-                except Exception as e:
-                    logger.warning(f"gnomAD request failed: {e}")
-                    raise
+            try:
+                response = await self._get_client().post(
+                    GNOMAD_API_URL,
+                    json={"query": query, "variables": variables or {}},
+                    headers={"Content-Type": "application/json"}
+                )
+                response.raise_for_status()
+                result = response.json()
+
+                if "errors" in result:
+                    logger.warning(f"gnomAD API errors: {result['errors']}")
+
+                return result.get("data", {})
+
+            except httpx.HTTPStatusError as e:
+                logger.warning(f"gnomAD API error {e.response.status_code}")
+                raise
+            except Exception as e:
+                logger.warning(f"gnomAD request failed: {e}")
+                raise
+
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key: str) -> Tuple[bool, Any]:
+        """Look up a fresh cache entry, marking it recently used. Returns (hit, value)."""
+        entry = cache.get(key)
+        if entry is None:
+            return False, None
+        if time.monotonic() - entry[0] >= CACHE_TTL_SECONDS:
+            del cache[key]
+            return False, None
+        cache.move_to_end(key)
+        return True, entry[1]
+
+    @staticmethod
+    def _cache_set(cache: OrderedDict, key: str, value: Any, maxsize: int) -> None:
+        """Store a cache entry, evicting the least recently used beyond maxsize."""
+        cache[key] = (time.monotonic(), value)
+        cache.move_to_end(key)
+        while len(cache) > maxsize:
+            cache.popitem(last=False)
+
+    async def _batched_field(
+        self,
+        field: str,
+        variable_types: Dict[str, str],
+        variables: Dict[str, Any]
+    ) -> Any:
+        """Resolve one top-level query field, batched with concurrent lookups.
+
+        Fields queued within BATCH_WINDOW_SECONDS go out as one query, each
+        under its own alias with its variables prefixed to keep them apart.
+        Returns the field's data (None if gnomAD has none).
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._batch.append((field, variable_types, variables, future))
+        if len(self._batch) >= BATCH_MAX_FIELDS:
+            self._flush_batch()
+        elif self._batch_timer is None:
+            self._batch_timer = asyncio.get_running_loop().call_later(
+                BATCH_WINDOW_SECONDS, self._flush_batch
+            )
+        return await future
+
+    def _flush_batch(self) -> None:
+        """Send the queued fields as one query."""
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        batch, self._batch = self._batch, []
+        if batch:
+            task = asyncio.ensure_future(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(
+        self,
+        batch: List[Tuple[str, Dict[str, str], Dict[str, Any], "asyncio.Future[Any]"]]
+    ) -> None:
+        """Run a batched query and hand each alias's data to its caller."""
+        declarations = []
+        selections = []
+        merged_variables: Dict[str, Any] = {}
+        for i, (field, variable_types, variables, _) in enumerate(batch):
+            prefix = f"b{i}_"
+            declarations.extend(
+                f"${prefix}{name}: {type_}" for name, type_ in variable_types.items()
+            )
+            aliased_field = VARIABLE_RE.sub(lambda m: f"${prefix}{m.group(1)}", field.strip())
+            selections.append(f"b{i}: {aliased_field}")
+            merged_variables.update({prefix + name: value for name, value in variables.items()})
+
+        query = f"query Batch({', '.join(declarations)}) {{\n" + "\n".join(selections) + "\n}"
+        try:
+            data = await self._graphql_request(query, merged_variables) or {}
+        except Exception as e:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for i, (*_, future) in enumerate(batch):
+            if not future.done():
+                future.set_result(data.get(f"b{i}"))
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     async def get_gene_variants(
@@ -78,12 +210,21 @@ class GnomADClient:
             List of variants with allele frequencies (including intronic)
         """
         cache_key = f"{gene_symbol}_{dataset}_{reference_genome}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        hit, cached = self._cache_get(self._gene_variants_cache, cache_key)
+        logger.debug(f"gnomAD gene variants cache {'hit' if hit else 'miss'} for {cache_key}")
+        if hit:
+            return cached
+
+        persisted_key = f"{PERSISTED_CACHE_VERSION}:{gene_symbol}:{dataset}:{reference_genome}"
+        persisted = await self._load_persisted_gene_variants(persisted_key)
+        if persisted is not None:
+            self._cache_set(
+                self._gene_variants_cache, cache_key, persisted, GENE_VARIANTS_CACHE_SIZE
+            )
+            return persisted
 
-        # GraphQL query for gene variants - get ALL variants including intronic
-        query = """
-        query GeneVariants($geneSymbol: String!, $datasetId: DatasetId!, $referenceGenome: ReferenceGenomeId!) {
+        # GraphQL field for gene variants - get ALL variants including intronic
+        field = """
           gene(gene_symbol: $geneSymbol, reference_genome: $referenceGenome) {
             variants(dataset: $datasetId) {
               variant_id
@@ -110,12 +251,16 @@ class GnomADClient:
               flags
             }
           }
-        }
         """
 
         try:
-            result = await self._graphql_request(
-                query,
+            gene_data = await self._batched_field(
+                field,
+                {
+                    "geneSymbol": "String!",
+                    "datasetId": "DatasetId!",
+                    "referenceGenome": "ReferenceGenomeId!"
+                },
                 {
                     "geneSymbol": gene_symbol,
                     "datasetId": dataset,
@@ -123,21 +268,26 @@ class GnomADClient:
                 }
             )
 
-            gene_data = result.get("gene")
             if not gene_data:
                 logger.info(f"No gnomAD data for gene {gene_symbol}")
                 return []
 
             variants = gene_data.get("variants", []) or []
 
-            # Parse ALL variants (not just coding)
+            # Parse ALL variants (not just coding). Each raw record is dropped
+            # once parsed, so the raw and parsed lists are never both held in
+            # full (peak memory stays at about the size of the raw response).
             parsed_variants = []
-            for v in variants:
+            for i, v in enumerate(variants):
+                variants[i] = None
                 parsed = self._parse_variant(v)
                 if parsed:
                     parsed_variants.append(parsed)
 
-            self._cache[cache_key] = parsed_variants
+            self._cache_set(
+                self._gene_variants_cache, cache_key, parsed_variants, GENE_VARIANTS_CACHE_SIZE
+            )
+            await self._save_persisted_gene_variants(persisted_key, parsed_variants)
             logger.info(f"Found {len(parsed_variants)} gnomAD variants for {gene_symbol}")
             return parsed_variants
 
@@ -145,6 +295,31 @@ class GnomADClient:
             logger.error(f"Error fetching gnomAD variants for {gene_symbol}: {e}")
             return []
 
+    async def _load_persisted_gene_variants(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Get a gene's variants saved by an earlier run, if still fresh."""
+        try:
+            async with async_session_maker() as db:
+                result = await db.execute(
+                    select(GnomadGeneVariants.variants)
+                    .where(GnomadGeneVariants.cache_key == key)
+                    .where(GnomadGeneVariants.cached_at > datetime.utcnow() - PERSISTED_CACHE_TTL)
+                )
+                return result.scalar_one_or_none()
+        except Exception as e:
+            logger.debug(f"Could not load cached gnomAD variants for {key}: {e}")
+            return None
+
+    async def _save_persisted_gene_variants(self, key: str, variants: List[Dict[str, Any]]) -> None:
+        """Save a gene's parsed variants to the database."""
+        try:
+            async with async_session_maker() as db:
+                await db.merge(GnomadGeneVariants(
+                    cache_key=key, variants=variants, cached_at=datetime.utcnow()
+                ))
+                await db.commit()
+        except Exception as e:
+            logger.debug(f"Could not save gnomAD variants for {key}: {e}")
+
     def _parse_variant(self, variant: Dict) -> Optional[Dict[str, Any]]:
         """Parse a gnomAD variant into a structured format."""
         try:
@@ -374,12 +549,13 @@ class GnomADClient:
         Returns:
             Variant data with AF if found
         """
-        cache_key = f"variant_{variant_id}_{dataset}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cache_key = f"{variant_id}_{dataset}"
+        hit, cached = self._cache_get(self._variant_cache, cache_key)
+        logger.debug(f"gnomAD variant cache {'hit' if hit else 'miss'} for {cache_key}")
+        if hit:
+            return cached
 
-        query = """
-        query VariantById($variantId: String!, $datasetId: DatasetId!, $referenceGenome: ReferenceGenomeId!) {
+        field = """
           variant(variantId: $variantId, dataset: $datasetId) {
             variant_id
             chrom
@@ -397,20 +573,14 @@ class GnomADClient:
               af
             }
           }
-        }
         """
 
         try:
-            result = await self._graphql_request(
-                query,
-                {
-                    "variantId": variant_id,
-                    "datasetId": dataset,
-                    "referenceGenome": reference_genome
-                }
+            variant = await self._batched_field(
+                field,
+                {"variantId": "String!", "datasetId": "DatasetId!"},
+                {"variantId": variant_id, "datasetId": dataset}
             )
-
-            variant = result.get("variant")
             if not variant:
                 return None
 
@@ -435,7 +605,7 @@ class GnomADClient:
                 "an": total_an,
             }
 
-            self._cache[cache_key] = result_data
+            self._cache_set(self._variant_cache, cache_key, result_data, VARIANT_CACHE_SIZE)
             return result_data
 
         except Exception as e:
@@ -482,3 +652,9 @@ def get_gnomad_client() -> GnomADClient:
     if _gnomad_client is None:
         _gnomad_client = GnomADClient()
     return _gnomad_client
+
+
+async def close_gnomad_client() -> None:
+    """Close the HTTP connections of the gnomAD client, if created."""
+    if _gnomad_client is not None:
+        await _gnomad_client.aclose()
@@ -20,7 +20,9 @@ import httpx
 import asyncio
 import re
 import json
-from typing import Optional, List, Dict, Any, Set
+import time
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Set, Tuple
 from tenacity import retry, stop_after_attempt, wait_exponential
 import logging
 
@@ -40,12 +42,22 @@ CDD_SOURCE_MAP = {
     "PHA": "CDD",  # Phage clusters
 }
 
+# Domain annotations only change with InterPro/UniProt releases
+COMPREHENSIVE_DOMAINS_TTL_SECONDS = 24 * 60 * 60
+# Genes kept, least recently used evicted first
+COMPREHENSIVE_DOMAINS_CACHE_SIZE = 1024
+
 
 class InterProClient:
     """Async client for InterPro REST API."""
 
     def __init__(self):
         self._semaphore = asyncio.Semaphore(5)  # Rate limit
+        # (gene symbol, include_cdd, cdd_evalue_threshold) -> (fetched_at, domains),
+        # in least to most recently used order
+        self._domains_cache: "OrderedDict[Tuple[str, bool, float], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        # Lookups in flight, shared by concurrent callers for the same key
+        self._domains_pending: Dict[Tuple[str, bool, float], "asyncio.Task[List[Dict[str, Any]]]"] = {}
 
     async def _request(self, endpoint: str, params: Optional[Dict] = None) -> Any:
         """Make a rate-limited request to InterPro API."""
@@ -343,8 +355,43 @@ class InterProClient:
             include_cdd: Whether to include direct NCBI CDD hits (default True)
             cdd_evalue_threshold: E-value cutoff for CDD hits (default 0.01)
 
-        Returns deduplicated, merged domain list.
+        Returns deduplicated, merged domain list. Results are cached per gene
+        for COMPREHENSIVE_DOMAINS_TTL_SECONDS (at most
+        COMPREHENSIVE_DOMAINS_CACHE_SIZE genes, least recently used evicted),
+        and concurrent calls for the same gene share one lookup.
         """
+        key = (gene_symbol, include_cdd, cdd_evalue_threshold)
+        cached = self._domains_cache.get(key)
+        if cached:
+            if time.monotonic() - cached[0] < COMPREHENSIVE_DOMAINS_TTL_SECONDS:
+                self._domains_cache.move_to_end(key)
+                return cached[1]
+            del self._domains_cache[key]
+
+        task = self._domains_pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._fetch_comprehensive_domains(gene_symbol, include_cdd, cdd_evalue_threshold)
+            )
+            self._domains_pending[key] = task
+            task.add_done_callback(lambda _: self._domains_pending.pop(key, None))
+
+        domains = await asyncio.shield(task)
+        # Empty results are not cached: lookup failures also come back empty
+        if domains:
+            self._domains_cache[key] = (time.monotonic(), domains)
+            self._domains_cache.move_to_end(key)
+            while len(self._domains_cache) > COMPREHENSIVE_DOMAINS_CACHE_SIZE:
+                self._domains_cache.popitem(last=False)
+        return domains
+
+    async def _fetch_comprehensive_domains(
+        self,
+        gene_symbol: str,
+        include_cdd: bool,
+        cdd_evalue_threshold: float
+    ) -> List[Dict[str, Any]]:
+        """Fetch and merge the domains for get_comprehensive_domains."""
         domains = []
 
         # First, get UniProt ID
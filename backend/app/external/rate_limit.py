@@ -0,0 +1,141 @@
+"""Client-side rate limiting for external APIs."""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+# Connection attempts retried by the HTTP transport before a request fails
+CONNECT_RETRIES = 2
+
+
+class TokenBucket:
+    """Async token bucket.
+
+    Allows bursts of up to `capacity` requests and refills at `rate` tokens per
+    second, so the long-run request rate stays at `rate`.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """Wait until `tokens` are available and take them."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for `seconds` after the server throttled us.
+
+        The burst allowance also shrinks by one token (down to one), so a
+        server that keeps throttling sees smaller bursts.
+        """
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0
+        self._updated = self._paused_until
+        self.capacity = max(1, self.capacity - 1)
+
+
+class ConcurrencyLimit:
+    """Async limit on requests in flight, adjustable at runtime.
+
+    Works like asyncio.Semaphore(limit) as an async context manager, but
+    set_limit() can raise or lower the limit while requests are running.
+    Lowering it lets in-flight requests finish and holds new ones until the
+    count drops below the new limit.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._active = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """Wait for a free slot and take it."""
+        async with self._condition:
+            try:
+                await self._condition.wait_for(lambda: self._active < self.limit)
+            except asyncio.CancelledError:
+                # This waiter may have been the one release() woke; pass the
+                # wakeup on so a free slot is not left waiting
+                self._condition.notify(1)
+                raise
+            self._active += 1
+
+    async def release(self) -> None:
+        """Give a slot back and wake one waiter."""
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify(1)
+
+    async def set_limit(self, limit: int) -> None:
+        """Change the limit; waiters are woken if it went up."""
+        async with self._condition:
+            raised = limit > self.limit
+            self.limit = limit
+            if raised:
+                self._condition.notify_all()
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.release()
+
+
+def retry_after_seconds(response: httpx.Response, default: float = 1.0) -> float:
+    """Parse a delta-seconds Retry-After header, falling back to `default`."""
+    value: Optional[str] = response.headers.get("Retry-After")
+    try:
+        return max(0.0, float(value)) if value is not None else default
+    except ValueError:
+        return default
+
+
+def is_retryable(exc: Exception) -> bool:
+    """Whether a failed request is worth retrying: transport errors, 429 and 5xx."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+async def with_retries(
+    send: Callable[[], Awaitable[T]],
+    attempts: int = 3,
+    min_wait: float = 1.0,
+    max_wait: float = 10.0,
+) -> T:
+    """Await `send()`, retrying transient failures with exponential backoff.
+
+    Other errors (including 404 and other 4xx) and the last failure are
+    re-raised unchanged.
+    """
+    for attempt in range(attempts):
+        try:
+            return await send()
+        except (httpx.HTTPStatusError, httpx.TransportError) as e:
+            if attempt == attempts - 1 or not is_retryable(e):
+                raise
+        await asyncio.sleep(min(max_wait, max(min_wait, 2 ** attempt)))
+    raise ValueError("attempts must be at least 1")
@@ -4,6 +4,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.api.v1 import router as api_router
 from app.database import init_db
+from app.external.ensembl import close_ensembl_clients
+from app.external.cbioportal import close_cbioportal_client
+from app.external.gnomad import close_gnomad_client
 
 
 @asynccontextmanager
@@ -12,7 +15,9 @@ async def lifespan(app: FastAPI):
     await init_db()
     yield
     # Shutdown
-    pass
+    await close_ensembl_clients()
+    await close_cbioportal_client()
+    await close_gnomad_client()
 
 
 app = FastAPI(
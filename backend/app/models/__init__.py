@@ -1,4 +1,5 @@
 from app.models.gene import Gene, Transcript, Exon, Protein, Domain
 from app.models.fusion import Session, Fusion
+from app.models.mutation import StudyProfile, GnomadGeneVariants
 
-__all__ = ["Gene", "Transcript", "Exon", "Protein", "Domain", "Session", "Fusion"]
+__all__ = ["Gene", "Transcript", "Exon", "Protein", "Domain", "Session", "Fusion", "StudyProfile", "GnomadGeneVariants"]
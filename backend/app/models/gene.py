@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Text, ForeignKey, DateTime, Float
+from sqlalchemy import Column, String, Integer, Text, ForeignKey, DateTime, Float, Index, func
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -17,6 +17,14 @@ class Gene(Base):
     biotype = Column(String(50))
     genome_build = Column(String(10), default="hg38")  # hg38 or hg19
     cached_at = Column(DateTime, default=datetime.utcnow)
+    last_accessed_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        # Case-insensitive prefix search on symbol (gene search endpoint)
+        Index("ix_gene_symbol_lower", func.lower(symbol)),
+        # Fresh-cache lookup in FusionBuilder
+        Index("ix_gene_symbol_build_cached", "symbol", "genome_build", "cached_at"),
+    )
 
     transcripts = relationship("Transcript", back_populates="gene", cascade="all, delete-orphan")
 
@@ -41,11 +49,16 @@ class Transcript(Base):
 
 class Exon(Base):
     __tablename__ = "exons"
+    __table_args__ = (
+        # The primary key leads with exon_id; this covers transcript-scoped
+        # lookups (all exons of a transcript, or a batch of exon IDs in one).
+        Index("ix_exon_transcript", "transcript_id", "exon_id"),
+    )
 
     # Composite primary key: exon_id + transcript_id
     # Same exon can belong to multiple transcripts in Ensembl
     exon_id = Column(String(50), primary_key=True)  # Ensembl exon ID
-    transcript_id = Column(String(50), ForeignKey("transcripts.id"), primary_key=True, index=True)
+    transcript_id = Column(String(50), ForeignKey("transcripts.id"), primary_key=True)
     rank = Column(Integer)
     start = Column(Integer)
     end = Column(Integer)
@@ -66,14 +79,20 @@ class Protein(Base):
     cached_at = Column(DateTime, default=datetime.utcnow)
 
     transcript = relationship("Transcript", back_populates="protein")
-    domains = relationship("Domain", back_populates="protein", cascade="all, delete-orphan")
+    # Explicit insertion order; the (protein_id, start, end) index would
+    # otherwise return them by position on new databases only
+    domains = relationship("Domain", back_populates="protein", cascade="all, delete-orphan", order_by="Domain.id")
 
 
 class Domain(Base):
     __tablename__ = "domains"
+    __table_args__ = (
+        # Domains of a protein, and position lookups when deduplicating them
+        Index("ix_domain_protein_span", "protein_id", "start", "end"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    protein_id = Column(String(50), ForeignKey("proteins.id"), index=True)
+    protein_id = Column(String(50), ForeignKey("proteins.id"))
     name = Column(String(255))
     description = Column(Text)
     source = Column(String(50))  # Pfam, SMART, Superfamily
@@ -82,6 +101,7 @@ class Domain(Base):
     end = Column(Integer)
     score = Column(Float)  # E-value or hit score from domain prediction
     data_provider = Column(String(50))  # InterPro, UniProt, or CDD - which API provided this data
+    is_kinase = Column(Integer, default=0)  # 1 = name matches KINASE_RE; NULL on rows cached before
     cached_at = Column(DateTime, default=datetime.utcnow)
 
     protein = relationship("Protein", back_populates="domains")
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, String, DateTime, JSON
+from datetime import datetime
+from app.database import Base
+
+
+class StudyProfile(Base):
+    """cBioPortal study -> mutation molecular profile, persisted across restarts."""
+    __tablename__ = "study_profiles"
+
+    study_id = Column(String(100), primary_key=True)
+    profile_id = Column(String(100))  # None: study has no mutation profile
+    cached_at = Column(DateTime, default=datetime.utcnow)
+
+
+class GnomadGeneVariants(Base):
+    """Parsed gnomAD variants of a gene, persisted across restarts."""
+    __tablename__ = "gnomad_gene_variants"
+
+    cache_key = Column(String(200), primary_key=True)  # version:gene:dataset:genome
+    variants = Column(JSON)
+    cached_at = Column(DateTime, default=datetime.utcnow)
@@ -61,6 +61,45 @@ class TestGeneEndpoints:
         response = client.get("/api/v1/genes/search?q=B")
         assert response.status_code == 400  # Query too short
 
+    @pytest.fixture
+    def domains_db(self, tmp_path):
+        import asyncio
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+        from sqlalchemy.pool import NullPool
+        from app.database import Base, get_db
+        from app.main import app
+        from app.models import Protein, Domain
+
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", poolclass=NullPool)
+        session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        async def seed():
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            async with session_maker() as db:
+                db.add(Protein(id="ENSP1_hg38", transcript_id="ENST1_hg38", length=500))
+                # Inserted out of position order
+                for name, start, end in [("Kinase", 300, 450), ("SH3", 60, 120), ("SH2", 130, 220)]:
+                    db.add(Domain(protein_id="ENSP1_hg38", name=name, source="Pfam", start=start, end=end))
+                    await db.flush()
+                await db.commit()
+
+        asyncio.run(seed())
+
+        async def override_get_db():
+            async with session_maker() as session:
+                yield session
+
+        app.dependency_overrides[get_db] = override_get_db
+        yield
+        app.dependency_overrides.pop(get_db, None)
+
+    def test_protein_domains_keep_insertion_order(self, domains_db):
+        client = get_client()
+        response = client.get("/api/v1/genes/proteins/ENSP1_hg38/domains")
+        assert response.status_code == 200
+        assert [d["name"] for d in response.json()["domains"]] == ["Kinase", "SH3", "SH2"]
+
 
 class TestExportEndpoints:
     def test_export_svg(self):
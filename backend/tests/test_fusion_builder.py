@@ -0,0 +1,40 @@
+import pytest
+from app.core.fusion_builder import FusionBuilder, domain_statuses
+
+
+class TestDomainStatuses:
+    def test_5prime_statuses(self):
+        spans = [(10, 50), (80, 120), (150, 200), (None, 40)]
+        assert domain_statuses(spans, 100, "5prime") == ["retained", "truncated", "lost", "unknown"]
+
+    def test_3prime_statuses(self):
+        spans = [(10, 50), (80, 120), (150, 200)]
+        assert domain_statuses(spans, 100, "3prime") == ["lost", "truncated", "retained"]
+
+    def test_unknown_breakpoint(self):
+        assert domain_statuses([(10, 50), (80, 120)], None, "5prime") == ["unknown", "unknown"]
+
+
+class TestCheckKinaseDomains:
+    def test_no_kinase(self):
+        assert FusionBuilder._check_kinase_domains([]) == (False, None)
+
+    @pytest.mark.parametrize("statuses", [
+        ["retained"],
+        ["retained", "truncated"],
+        ["truncated", "retained"],
+        ["lost", "retained", "lost"],
+    ])
+    def test_retained_wins(self, statuses):
+        assert FusionBuilder._check_kinase_domains(statuses) == (True, True)
+
+    @pytest.mark.parametrize("statuses", [
+        ["truncated"],
+        ["lost"],
+        ["lost", "truncated", "unknown"],
+    ])
+    def test_not_retained(self, statuses):
+        assert FusionBuilder._check_kinase_domains(statuses) == (True, False)
+
+    def test_unknown_status(self):
+        assert FusionBuilder._check_kinase_domains(["unknown"]) == (True, None)
@@ -0,0 +1,78 @@
+import pytest
+from app.core.mapping.genomic_to_protein import ExonIndex, GenomicToProteinMapper
+
+
+EXONS = [
+    {"start": 100, "end": 199},
+    {"start": 300, "end": 399},
+    {"start": 500, "end": 599},
+]
+
+
+class TestExonIndex:
+    @pytest.mark.parametrize("position, expected", [
+        (150, 1),     # CDS start
+        (199, 50),
+        (250, 50),    # intron -> end of previous exon
+        (300, 51),
+        (550, 201),   # CDS end
+        (700, 201),   # past the CDS
+        (50, None),   # before the CDS
+    ])
+    def test_plus_strand_cds_position(self, position, expected):
+        index = ExonIndex(EXONS, 150, 550, negative_strand=False)
+        assert index.cds_position(position) == expected
+
+    @pytest.mark.parametrize("position, expected", [
+        (550, 1),     # CDS start
+        (500, 51),
+        (450, 51),    # intron -> end of previous exon
+        (399, 52),
+        (150, 201),   # CDS end
+        (50, 201),    # past the CDS
+        (700, None),  # before the CDS
+    ])
+    def test_minus_strand_cds_position(self, position, expected):
+        index = ExonIndex(list(reversed(EXONS)), 150, 550, negative_strand=True)
+        assert index.cds_position(position) == expected
+
+    def test_cds_length_before(self):
+        index = ExonIndex(EXONS, 150, 550, negative_strand=False)
+        assert index.total_cds == 201
+        assert index.cds_length_before(100) == 0
+        assert index.cds_length_before(160) == 11
+        assert index.cds_length_before(250) == 50
+        assert index.cds_length_before(999) == 201
+
+
+class _FakeEnsembl:
+    def __init__(self):
+        self.lookups = 0
+
+    async def get_transcript(self, transcript_id):
+        self.lookups += 1
+        return {"id": transcript_id, "Exon": EXONS, "Translation": {"start": 150, "end": 550}}
+
+
+class TestMapBreakpointsBulk:
+    @pytest.mark.asyncio
+    async def test_matches_single_lookups(self):
+        ensembl = _FakeEnsembl()
+        mapper = GenomicToProteinMapper(ensembl)
+        positions = [150, 250, 300, 550, 700, 50]
+        bulk = await mapper.map_breakpoints_bulk("ENST1_hg38", positions, "+")
+
+        assert bulk == [1, 50, 51, 201, 201, None]
+        assert ensembl.lookups == 1
+        for position, cds_pos in zip(positions, bulk):
+            aa_pos = await mapper.map_genomic_to_aa("1", position, "+", "ENST1")
+            assert aa_pos == (None if cds_pos is None else (cds_pos - 1) // 3 + 1)
+
+    @pytest.mark.asyncio
+    async def test_seeded_transcript_skips_lookup(self):
+        ensembl = _FakeEnsembl()
+        mapper = GenomicToProteinMapper(ensembl)
+        mapper.seed_transcript("ENST1_hg38", EXONS, 150, 550)
+
+        assert await mapper.map_breakpoints_bulk("ENST1", [150, 300], "+") == [1, 51]
+        assert ensembl.lookups == 0
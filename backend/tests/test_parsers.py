@@ -1,6 +1,6 @@
 import pytest
 from app.core.parsers import StarFusionParser, ArribaParser, ManualInputParser
-from app.schemas.fusion import FusionManualInput
+from app.schemas.fusion import FusionCreate, FusionManualInput
 
 
 class TestStarFusionParser:
@@ -60,6 +60,21 @@ EML4\tALK\t+/+\t-/-\tchr2:42492091\tchr2:29446394\tCDS\tCDS\tinversion\tdownstre
         assert bcr_abl.junction_reads == 50  # split_reads1 + split_reads2
         assert bcr_abl.spanning_reads == 30  # discordant_mates
 
+        # Built without validation, but identical to a validated model
+        assert FusionCreate.model_validate(bcr_abl.model_dump()) == bcr_abl
+
+    def test_merges_duplicate_rows(self):
+        content = """#gene1\tgene2\tstrand1(gene/fusion)\tstrand2(gene/fusion)\tbreakpoint1\tbreakpoint2\tsite1\tsite2\ttype\tdirection\tsplit_reads1\tsplit_reads2\tdiscordant_mates
+BCR\tABL1\t+/+\t-/-\tchr22:23632600\tchr9:130854064\tCDS\tCDS\ttranslocation\tdownstream\t25\t25\t30
+EML4\tALK\t+/+\t-/-\tchr2:42492091\tchr2:29446394\tCDS\tCDS\tinversion\tdownstream\t15\t10\t20
+BCR\tABL1\t+/+\t-/-\tchr22:23632600\tchr9:130854064\tCDS\tCDS\ttranslocation\tdownstream\t5\t0\t2"""
+
+        fusions = ArribaParser().parse(content)
+
+        assert [f.gene_a_symbol for f in fusions] == ["BCR", "EML4"]
+        assert fusions[0].junction_reads == 55
+        assert fusions[0].spanning_reads == 32
+
 
 class TestManualInputParser:
     def test_parse_batch_input(self):
@@ -0,0 +1,84 @@
+import asyncio
+
+import httpx
+import pytest
+from app.external.rate_limit import ConcurrencyLimit, with_retries
+
+
+class TestConcurrencyLimit:
+    @pytest.mark.asyncio
+    async def test_raising_limit_admits_waiters(self):
+        limit = ConcurrencyLimit(1)
+        await limit.acquire()
+        waiter = asyncio.ensure_future(limit.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await limit.set_limit(2)
+        await asyncio.wait_for(waiter, 1)
+        assert limit._active == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_passes_on_wakeup(self):
+        limit = ConcurrencyLimit(1)
+        await limit.acquire()
+        first = asyncio.ensure_future(limit.acquire())
+        second = asyncio.ensure_future(limit.acquire())
+        await asyncio.sleep(0)
+
+        # The release wakes the first waiter, which is cancelled before it runs
+        await limit.release()
+        first.cancel()
+        await asyncio.wait_for(second, 1)
+        assert first.cancelled()
+        assert limit._active == 1
+
+    @pytest.mark.asyncio
+    async def test_caps_requests_in_flight(self):
+        limit = ConcurrencyLimit(2)
+        active = peak = 0
+
+        async def request():
+            nonlocal active, peak
+            async with limit:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0)
+                active -= 1
+
+        await asyncio.gather(*(request() for _ in range(6)))
+        assert peak == 2
+        assert limit._active == 0
+
+
+def _status_error(status):
+    request = httpx.Request("GET", "https://example.org")
+    response = httpx.Response(status, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+class TestWithRetries:
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors(self):
+        errors = [_status_error(503), httpx.ConnectError("reset")]
+
+        async def send():
+            if errors:
+                raise errors.pop(0)
+            return "ok"
+
+        assert await with_retries(send, min_wait=0, max_wait=0) == "ok"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status, expected_calls", [(404, 1), (500, 3)])
+    async def test_reraises_original_error(self, status, expected_calls):
+        calls = 0
+
+        async def send():
+            nonlocal calls
+            calls += 1
+            raise _status_error(status)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await with_retries(send, min_wait=0, max_wait=0)
+        assert calls == expected_calls